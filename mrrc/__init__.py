@@ -8,6 +8,7 @@ The Python wrapper aims for API compatibility with pymarc.
 """
 
 import contextlib
+from collections.abc import Iterable, Sequence
 from typing import Any, ClassVar, Optional, Union
 
 from . import _mrrc
@@ -242,7 +243,7 @@ class Field:
         indicator1: str = " ",
         indicator2: str = " ",
         *,
-        subfields: list[Subfield] | None = None,
+        subfields: list[Subfield | tuple[str, str]] | None = None,
         indicators: list[str] | None = None,
         data: str | None = None,
     ):
@@ -252,7 +253,8 @@ class Field:
             tag: 3-character field tag.
             indicator1: First indicator (default ' ').
             indicator2: Second indicator (default ' ').
-            subfields: Optional list of Subfield objects to add.
+            subfields: Optional list of Subfield objects or ``(code, value)``
+                pairs to add; the whole list is converted in one call.
             indicators: Optional list/tuple of [ind1, ind2], overrides indicator1/indicator2.
             data: For control fields, the data string value.
         """
@@ -545,6 +547,11 @@ class Field:
         self._refresh()
         return self._inner.subfields()
 
+    def subfield_codes(self) -> list[str]:
+        """Get subfield codes in order, without creating Subfield objects."""
+        self._refresh()
+        return self._inner.subfield_codes()
+
     def subfields_by_code(self, code: str) -> list[str]:
         """Get subfield values by code."""
         self._refresh()
@@ -598,17 +605,22 @@ class Field:
     def indicators(
         self, value: Union["Indicators", tuple[str, str], list[str]]
     ) -> None:
-        """Set indicators from Indicators object or tuple/list (pymarc compatibility)."""
+        """Set indicators from Indicators object or tuple/list (pymarc compatibility).
+
+        Both indicators are written back to the record in one update.
+        """
         if isinstance(value, Indicators):
-            self.indicator1 = value.ind1
-            self.indicator2 = value.ind2
+            ind1, ind2 = value.ind1, value.ind2
         elif isinstance(value, (tuple, list)) and len(value) == 2:
-            self.indicator1 = value[0]
-            self.indicator2 = value[1]
+            ind1, ind2 = value
         else:
             raise ValueError(
                 "indicators must be Indicators object or [ind1, ind2] tuple/list"
             )
+        self._refresh()
+        self._inner.indicator1 = ind1
+        self._inner.indicator2 = ind2
+        self._writeback()
 
     def is_subject_field(self) -> bool:
         """Check if this is a subject field (6xx)."""
@@ -750,6 +762,15 @@ class Leader:
         "u": "Unknown",
     }
 
+    # Built once with the class rather than on every lookup.
+    _VALUES_BY_POSITION: ClassVar[dict[int, dict[str, str]]] = {
+        5: RECORD_STATUS_VALUES,
+        6: RECORD_TYPE_VALUES,
+        7: BIBLIOGRAPHIC_LEVEL_VALUES,
+        17: ENCODING_LEVEL_VALUES,
+        18: CATALOGING_FORM_VALUES,
+    }
+
     @classmethod
     def get_valid_values(cls, position: int) -> dict | None:
         """Get dictionary of valid values for a leader position.
@@ -775,14 +796,7 @@ class Leader:
             None
             ```
         """
-        position_map = {
-            5: cls.RECORD_STATUS_VALUES,
-            6: cls.RECORD_TYPE_VALUES,
-            7: cls.BIBLIOGRAPHIC_LEVEL_VALUES,
-            17: cls.ENCODING_LEVEL_VALUES,
-            18: cls.CATALOGING_FORM_VALUES,
-        }
-        return position_map.get(position)
+        return cls._VALUES_BY_POSITION.get(position)
 
     @classmethod
     def is_valid_value(cls, position: int, value: str) -> bool:
@@ -1046,8 +1060,45 @@ class Record:
         self._inner = _Record(rust_leader)
         self._leader = leader
         if fields:
-            for field in fields:
-                self.add_field(field)
+            self.add_field(*fields)
+
+    @classmethod
+    def build(
+        cls,
+        control_fields: Sequence[tuple[str, str]] = (),
+        data_fields: Sequence[
+            tuple[str, str, str, Sequence[tuple[str, str]]]
+        ] = (),
+        *,
+        leader: Leader | None = None,
+    ) -> "Record":
+        """Build a record from plain field specs in one Rust call.
+
+        Equivalent to creating a ``Record`` and adding each field with
+        ``add_control_field`` / ``Field`` + ``add_subfield`` +
+        ``add_field``, without the per-field round trips.
+
+        Args:
+            control_fields: ``(tag, value)`` pairs, e.g.
+                ``[("001", "id-1")]``.
+            data_fields: ``(tag, ind1, ind2, subfields)`` tuples, where
+                ``subfields`` is a sequence of ``(code, value)`` pairs,
+                e.g. ``[("245", "1", "0", [("a", "Title")])]``.
+            leader: Optional Leader object (defaults to Leader()).
+
+        Raises:
+            ValueError: If a tag is not 3 characters or a subfield code
+                is empty.
+        """
+        if leader is None:
+            leader = Leader()
+        rust_leader = (
+            leader._rust_leader if isinstance(leader, Leader) else leader
+        )
+        record = cls.__new__(cls)
+        record._inner = _Record.build(rust_leader, control_fields, data_fields)
+        record._leader = leader
+        return record
 
     def __getattr__(self, name: str) -> Any:
         """Delegate attribute access to the inner Rust Record."""
@@ -1076,9 +1127,7 @@ class Record:
 
     def __contains__(self, tag: str) -> bool:
         """Check if a field with given tag exists in record."""
-        if _is_control_tag(tag):
-            return self._inner.control_field(tag) is not None
-        return self.get_field(tag) is not None
+        return tag in self._inner
 
     def __iter__(self):
         """Iterate over all fields (control and data) as live handles.
@@ -1144,12 +1193,19 @@ class Record:
         return result
 
     def add_field(self, *fields: "Field") -> None:
-        """Add one or more fields to the record."""
+        """Add one or more fields to the record.
+
+        Data fields are handed to Rust in a single batch, so adding many
+        fields at once costs one call rather than one per field.
+        """
+        data_fields = []
         for field in fields:
             if field.is_control_field():
                 self._inner.add_control_field(field.tag, field.data or "")
             else:
-                self._inner.add_field(field._inner)
+                data_fields.append(field._inner)
+        if data_fields:
+            self._inner.add_fields(data_fields)
 
     def get(self, tag: str, default=None):
         """Get first field with given tag, or default (pymarc compatibility)."""
@@ -1536,12 +1592,12 @@ class Record:
             ...     print(field["a"])
             ```
         """
-        result = []
-        for field in self._inner.fields_by_indicator(
-            tag, indicator1=indicator1, indicator2=indicator2
-        ):
-            result.append(_wrap_field(field))
-        return result
+        return [
+            _wrap_field(field)
+            for field in self._inner.fields_by_indicator(
+                tag, indicator1=indicator1, indicator2=indicator2
+            )
+        ]
 
     def fields_in_range(self, start_tag: str, end_tag: str) -> list["Field"]:
         """Get fields within a tag range (inclusive).
@@ -1564,10 +1620,10 @@ class Record:
             ...     print(f"{field.tag}: {field['a']}")
             ```
         """
-        result = []
-        for field in self._inner.fields_in_range(start_tag, end_tag):
-            result.append(_wrap_field(field))
-        return result
+        return [
+            _wrap_field(field)
+            for field in self._inner.fields_in_range(start_tag, end_tag)
+        ]
 
     def fields_matching(self, query: "FieldQuery") -> list["Field"]:
         """Get fields matching a FieldQuery.
@@ -1589,10 +1645,9 @@ class Record:
             ...     print(field["a"])
             ```
         """
-        result = []
-        for field in self._inner.fields_matching(query):
-            result.append(_wrap_field(field))
-        return result
+        return [
+            _wrap_field(field) for field in self._inner.fields_matching(query)
+        ]
 
     def fields_matching_range(self, query: "TagRangeQuery") -> list["Field"]:
         """Get fields matching a TagRangeQuery.
@@ -1613,10 +1668,10 @@ class Record:
             >>> subjects = record.fields_matching_range(query)
             ```
         """
-        result = []
-        for field in self._inner.fields_matching_range(query):
-            result.append(_wrap_field(field))
-        return result
+        return [
+            _wrap_field(field)
+            for field in self._inner.fields_matching_range(query)
+        ]
 
     def fields_matching_pattern(
         self, query: "SubfieldPatternQuery"
@@ -1639,10 +1694,37 @@ class Record:
             >>> isbn13_fields = record.fields_matching_pattern(query)
             ```
         """
-        result = []
-        for field in self._inner.fields_matching_pattern(query):
-            result.append(_wrap_field(field))
-        return result
+        return [
+            _wrap_field(field)
+            for field in self._inner.fields_matching_pattern(query)
+        ]
+
+    def fields_matching_patterns(
+        self, queries: list["SubfieldPatternQuery"]
+    ) -> list[list["Field"]]:
+        """Get fields matching each of several SubfieldPatternQuery objects.
+
+        Equivalent to calling ``fields_matching_pattern`` once per query,
+        but evaluates all of them in a single call into Rust.
+
+        Args:
+            queries: SubfieldPatternQuery objects to evaluate.
+
+        Returns:
+            One list of matching Field objects per query, in query order.
+
+        Example:
+            ```pycon
+            >>> isbn13, older = record.fields_matching_patterns([
+            ...     SubfieldPatternQuery("020", "a", r"^97[89]-"),
+            ...     SubfieldPatternQuery("260", "c", r"^19"),
+            ... ])
+            ```
+        """
+        return [
+            [_wrap_field(field) for field in fields]
+            for fields in self._inner.fields_matching_patterns(queries)
+        ]
 
     def fields_matching_value(
         self, query: "SubfieldValueQuery"
@@ -1669,10 +1751,10 @@ class Record:
             >>> related_fields = record.fields_matching_value(query)
             ```
         """
-        result = []
-        for field in self._inner.fields_matching_value(query):
-            result.append(_wrap_field(field))
-        return result
+        return [
+            _wrap_field(field)
+            for field in self._inner.fields_matching_value(query)
+        ]
 
     def to_json(self) -> str:
         """Serialize to JSON."""
@@ -1682,6 +1764,10 @@ class Record:
         """Serialize to MARCXML."""
         return self._inner.to_xml()
 
+    def to_xml_bytes(self) -> bytes:
+        """Serialize to MARCXML as UTF-8 bytes, skipping the str decode."""
+        return self._inner.to_xml_bytes()
+
     def to_dublin_core(self) -> str:
         """Serialize to Dublin Core."""
         return self._inner.to_dublin_core()
@@ -1799,40 +1885,27 @@ class Record:
         """Alias for as_marc() (pymarc compatibility)."""
         return self.as_marc()
 
-    def __eq__(self, other: Any) -> bool:
-        """Compare records by content."""
-        if not isinstance(other, Record):
-            return False
-        # Compare leaders and control fields and fields
-        self_fields = self._inner.fields()
-        other_fields = other._inner.fields()
+    def write_marc21(self, out: bytearray) -> int:
+        """Append the record's ISO 2709 bytes to ``out``.
 
-        # Same number of fields
-        if len(self_fields) != len(other_fields):
-            return False
+        Lets a caller serialize many records into one growing buffer
+        instead of allocating a ``bytes`` object per record.
 
-        # Compare each field
-        for self_f, other_f in zip(self_fields, other_fields, strict=False):
-            if (
-                self_f.tag != other_f.tag
-                or self_f.indicator1 != other_f.indicator1
-                or self_f.indicator2 != other_f.indicator2
-                or len(self_f.subfields()) != len(other_f.subfields())
-            ):
-                return False
-            for self_sf, other_sf in zip(
-                self_f.subfields(), other_f.subfields(), strict=False
-            ):
-                if (
-                    self_sf.code != other_sf.code
-                    or self_sf.value != other_sf.value
-                ):
-                    return False
+        Returns:
+            Number of bytes appended.
+        """
+        self._sync_leader()
+        return self._inner.write_marc21(out)
 
-        # Compare control fields
-        self_cfs = self._inner.control_fields()
-        other_cfs = other._inner.control_fields()
-        return self_cfs == other_cfs
+    def __eq__(self, other: Any) -> bool:
+        """Compare records by content: control and data fields, in order.
+
+        The leader is not compared. The comparison runs in Rust without
+        creating per-field wrapper objects.
+        """
+        if not isinstance(other, Record):
+            return False
+        return self._inner.fields_equal(other._inner)
 
     def __hash__(self) -> int:
         """Hash based on leader."""
@@ -1843,7 +1916,8 @@ class MARCReader:
     """MARC Reader wrapper.
 
     Args:
-        file_obj: File path (str), pathlib.Path, bytes/bytearray, or file-like object.
+        file_obj: File path (str), pathlib.Path, bytes/bytearray, read-only
+            memoryview, or file-like object.
         to_unicode: Accepted for pymarc compatibility. mrrc always converts
             MARC-8 to UTF-8; passing ``False`` emits a warning.
         permissive: When ``True``, yields ``None`` for records that fail to
@@ -1971,6 +2045,33 @@ class MARCReader:
         """The backend type: ``"rust_file"``, ``"cursor"``, or ``"python_file"``."""
         return self._inner.backend_type
 
+    def count_records(self) -> int:
+        """Count the remaining records without building ``Record`` objects.
+
+        Parses exactly as iteration does, but never materializes a Python
+        record, so counting a large file allocates nothing per record.
+        Consumes the reader. With ``permissive=True``, records that fail to
+        parse are skipped (and not counted) instead of raising. Once
+        ``__next__`` has been called, ``current_chunk`` afterwards holds the
+        bytes of the last record consumed here.
+        """
+        return self._inner.count_records(skip_failed=self._permissive)
+
+    def drain(self) -> list[Record]:
+        """Read all remaining records into a list.
+
+        Returns the same records as ``list(reader)``, but collects them in
+        one call instead of one ``__next__`` per record. Consumes the
+        reader. With ``permissive=True``, records that fail to parse are
+        skipped rather than returned as ``None``. Once ``__next__`` has been
+        called, ``current_chunk`` afterwards holds the bytes of the last
+        record drained.
+        """
+        return [
+            _wrap_record(record)
+            for record in self._inner.drain(skip_failed=self._permissive)
+        ]
+
     def read_record(self) -> Record | None:
         """Read next record (pymarc compatibility)."""
         try:
@@ -2019,7 +2120,14 @@ class MARCReader:
 
 
 class MARCWriter:
-    """MARC Writer wrapper."""
+    """MARC Writer wrapper.
+
+    A ``str`` or ``pathlib.Path`` target is buffered in Rust and flushed
+    on ``close()``. A file object receives one ``write()`` call per record
+    (one per batch for ``write_records``) and is flushed, but not closed,
+    on ``close()``, so in-memory buffers can be read back afterwards. Use
+    the writer as a context manager to close it.
+    """
 
     def __init__(self, file_obj: Any):
         """Create a new MARC writer."""
@@ -2035,6 +2143,25 @@ class MARCWriter:
         """Write a record (alias for write)."""
         self.write(record)
 
+    def write_records(self, records: Iterable[Record]) -> int:
+        """Write many records in one call.
+
+        Serializes the whole batch with a single GIL release and hands the
+        bytes to the underlying file in one write. If any record fails to
+        serialize, nothing from the batch is written.
+
+        Args:
+            records: An iterable of Record objects.
+
+        Returns:
+            The number of records written.
+        """
+        inner = []
+        for record in records:
+            record._sync_leader()
+            inner.append(record._inner)
+        return self._inner.write_records(inner)
+
     def close(self) -> None:
         """Close the writer."""
         self._inner.close()
@@ -1,6 +1,6 @@
 """Type stubs for the mrrc native extension module."""
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import Any, final
 
 __version__: str
@@ -182,7 +182,7 @@ class Field:
         indicator1: str | None = None,
         indicator2: str | None = None,
         *,
-        subfields: list[Subfield] | None = None,
+        subfields: list[Subfield | tuple[str, str]] | None = None,
         indicators: list[str] | None = None,
     ) -> Field: ...
     def __repr__(self) -> str: ...
@@ -203,6 +203,9 @@ class Field:
     def subfields(self) -> list[Subfield]:
         """Get all subfields in this field."""
         ...
+    def subfield_codes(self) -> list[str]:
+        """Get the subfield codes in order, without creating Subfield objects."""
+        ...
     def subfields_by_code(self, code: str) -> list[str]:
         """Get all subfield values for a given code.
 
@@ -246,10 +249,33 @@ class Record:
     A MARC record consists of a leader, control fields (000-009), and data fields (010+).
     """
     def __new__(cls, leader: Leader) -> Record: ...
+    @staticmethod
+    def build(
+        leader: Leader,
+        control_fields: list[tuple[str, str]],
+        data_fields: list[tuple[str, str, str, list[tuple[str, str]]]],
+    ) -> Record:
+        """Build a record from plain field specs in a single call.
+
+        Args:
+            leader: Record leader
+            control_fields: ``(tag, value)`` pairs, added in order
+            data_fields: ``(tag, ind1, ind2, [(code, value), ...])``
+                tuples, added in order
+
+        Raises:
+            ValueError: If a tag is not 3 characters or a subfield code
+                is empty
+        """
+        ...
     def __repr__(self) -> str: ...
     def __str__(self) -> str: ...
     def __eq__(self, other: object, /) -> bool: ...
     def __deepcopy__(self, _memo: object) -> Record: ...
+    def __contains__(self, tag: str) -> bool: ...
+    def fields_equal(self, other: Record) -> bool:
+        """Compare control and data fields in order, ignoring the leader."""
+        ...
     @property
     def errors(self) -> list[Exception]:
         """Non-fatal errors accumulated while parsing this record.
@@ -268,6 +294,9 @@ class Record:
     def add_field(self, field: Field) -> None:
         """Add a data field to the record."""
         ...
+    def add_fields(self, fields: list[Field]) -> None:
+        """Add several data fields to the record, in order, in one call."""
+        ...
     def add_control_field(self, tag: str, value: str) -> None:
         """Add a control field (000-009).
 
@@ -392,6 +421,9 @@ class Record:
     def fields_matching_pattern(
         self, query: SubfieldPatternQuery
     ) -> list[Field]: ...
+    def fields_matching_patterns(
+        self, queries: list[SubfieldPatternQuery]
+    ) -> list[list[Field]]: ...
     def fields_matching_value(
         self, query: SubfieldValueQuery
     ) -> list[Field]: ...
@@ -422,12 +454,23 @@ class Record:
     def is_audiovisual(self) -> bool: ...
     def to_json(self) -> str: ...
     def to_xml(self) -> str: ...
+    def to_xml_bytes(self) -> bytes: ...
     def to_dublin_core(self) -> str: ...
     def to_marcjson(self) -> str: ...
     def to_mods(self) -> str: ...
     def to_marc21(self) -> bytes:
         """Serialize the record to ISO 2709 binary format."""
         ...
+    def write_marc21(self, out: bytearray) -> int:
+        """Append the record's ISO 2709 bytes to ``out``.
+
+        Returns:
+            Number of bytes appended
+
+        Raises:
+            BufferError: If ``out`` is exported and cannot be resized
+        """
+        ...
 
 @final
 class AuthorityRecord:
@@ -628,6 +671,7 @@ class MARCReader:
     Accepts multiple input types:
     - str or pathlib.Path: File path (pure Rust I/O, zero GIL overhead)
     - bytes or bytearray: In-memory data
+    - memoryview: In-memory data; a view over bytes is not copied
     - file object: Python file-like object (GIL managed)
 
     Thread Safety:
@@ -683,6 +727,41 @@ class MARCReader:
         Returns:
             A Record instance, or None if EOF reached
 
+        Raises:
+            ValueError: If the binary data is malformed
+            IOError: If an I/O error occurs
+        """
+        ...
+    def count_records(self, *, skip_failed: bool = False) -> int:
+        """Count the remaining records without building Record objects.
+
+        Parses exactly as iteration does, but no Python object is created
+        per record. Consumes the reader.
+
+        Args:
+            skip_failed: Skip records whose parse fails instead of raising.
+                Skipped records are not counted.
+
+        Returns:
+            Number of records read
+
+        Raises:
+            ValueError: If the binary data is malformed
+            IOError: If an I/O error occurs
+        """
+        ...
+    def drain(self, *, skip_failed: bool = False) -> list[Record]:
+        """Read all remaining records into a list in one call.
+
+        Parses exactly as iteration does, without a ``__next__`` call per
+        record. Consumes the reader.
+
+        Args:
+            skip_failed: Skip records whose parse fails instead of raising.
+
+        Returns:
+            The remaining records, in source order
+
         Raises:
             ValueError: If the binary data is malformed
             IOError: If an I/O error occurs
@@ -740,6 +819,22 @@ class MARCWriter:
         """
         ...
     def write(self, record: Record) -> None: ...
+    def write_records(self, records: Iterable[Record]) -> int:
+        """Write many records with one GIL release for the whole batch.
+
+        Args:
+            records: Iterable of Record instances to write
+
+        Returns:
+            Number of records written
+
+        Raises:
+            TypeError: If an item is not a Record
+            ValueError: If a record is invalid (nothing from the batch is
+                written)
+            IOError: If an I/O error occurs
+        """
+        ...
     def close(self) -> None:
         """Close the writer and flush the buffer.
 
@@ -764,6 +859,14 @@ class AuthorityMARCReader:
         self, _exc_type: Any, _exc_val: Any, _exc_tb: Any
     ) -> bool: ...
     def read_record(self) -> AuthorityRecord | None: ...
+    @property
+    def backend_type(self) -> str:
+        """The backend type: ``"rust_file"``, ``"cursor"``, or ``"python_file"``.
+
+        Raises:
+            RuntimeError: If the reader has been consumed.
+        """
+        ...
 
 @final
 class HoldingsMARCReader:
@@ -782,6 +885,14 @@ class HoldingsMARCReader:
         self, _exc_type: Any, _exc_val: Any, _exc_tb: Any
     ) -> bool: ...
     def read_record(self) -> HoldingsRecord | None: ...
+    @property
+    def backend_type(self) -> str:
+        """The backend type: ``"rust_file"``, ``"cursor"``, or ``"python_file"``.
+
+        Raises:
+            RuntimeError: If the reader has been consumed.
+        """
+        ...
 
 # =============================================================================
 # Format Conversion Functions
@@ -978,6 +1089,24 @@ class RecordBoundaryScanner:
     def scan_limited(
         self, data: bytes, limit: int
     ) -> list[tuple[int, int]]: ...
+    def scan_into(self, data: bytes, out: Any) -> int:
+        """Write ``offset, length`` pairs into a writable int64 buffer.
+
+        ``out`` is any writable, C-contiguous buffer of 64-bit signed
+        integers (``array.array("q")``, a NumPy ``int64`` array, ...). It
+        holds one boundary per two elements: ``out.size // 2`` for a NumPy
+        array, or ``out.nbytes // 16`` for any buffer. Pair ``i`` occupies
+        flat elements ``2 * i`` and ``2 * i + 1`` (row ``i`` of an
+        ``(n, 2)`` array).
+
+        Returns:
+            Number of boundaries written
+
+        Raises:
+            ValueError: If the data has no complete records, or ``out`` is
+                read-only or not C-contiguous
+        """
+        ...
     def count_records(self, data: bytes) -> int: ...
     def clear(self) -> None: ...
     def capacity(self) -> int: ...
@@ -994,13 +1123,20 @@ class ProducerConsumerPipeline:
     ) -> ProducerConsumerPipeline: ...
     def next(self) -> Record | None: ...
     def try_next(self) -> Record | None: ...
+    def count(self) -> int:
+        """Drain the pipeline and return how many records it produced.
+
+        Consumes the remaining records in Rust without creating Python
+        Record objects.
+        """
+        ...
 
 def parse_batch_parallel(
     boundaries: list[tuple[int, int]],
-    buffer: bytes | bytearray,
+    buffer: bytes | bytearray | memoryview,
 ) -> list[Record]: ...
 def parse_batch_parallel_limited(
     boundaries: list[tuple[int, int]],
-    buffer: bytes | bytearray,
+    buffer: bytes | bytearray | memoryview,
     limit: int,
 ) -> list[Record]: ...
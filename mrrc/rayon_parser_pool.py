@@ -51,7 +51,7 @@ __all__ = ["parse_batch_parallel", "parse_batch_parallel_limited"]
 
 
 def parse_batch_parallel(
-    boundaries: list[tuple[int, int]], buffer: bytes | bytearray
+    boundaries: list[tuple[int, int]], buffer: bytes | bytearray | memoryview
 ) -> list:
     """Parse a batch of MARC record boundaries in parallel using Rayon.
 
@@ -65,7 +65,9 @@ def parse_batch_parallel(
     - `boundaries`: List of (offset, length) tuples identifying record boundaries.
                     These are typically obtained from RecordBoundaryScanner.scan().
     - `buffer`: The complete binary buffer containing all records.
-                Can be bytes or bytearray.
+                Can be bytes, bytearray, or memoryview. bytes and views
+                over bytes are parsed in place; a bytearray or any other
+                view (including one over an mmap) is copied first.
 
     # Returns
 
@@ -111,7 +113,9 @@ def parse_batch_parallel(
 
 
 def parse_batch_parallel_limited(
-    boundaries: list[tuple[int, int]], buffer: bytes | bytearray, limit: int
+    boundaries: list[tuple[int, int]],
+    buffer: bytes | bytearray | memoryview,
+    limit: int,
 ) -> list:
     """Parse a limited batch of MARC records in parallel.
 
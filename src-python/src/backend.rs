@@ -8,8 +8,9 @@
 use crate::chunked_py_reader::ChunkedPyFileReader;
 use crate::parse_error::ParseError;
 use mrrc::RecoveryMode;
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
+use pyo3::types::{PyBytes, PyMemoryView};
 use std::fs::File;
 use std::io::{BufReader, Cursor, Read};
 
@@ -19,6 +20,24 @@ use std::io::{BufReader, Cursor, Read};
 /// syscall per buffer fill.
 pub(crate) const FILE_READ_BUF_CAPACITY: usize = 64 * 1024;
 
+/// Buffer of a memoryview that can be borrowed without a copy, or `None`.
+///
+/// A view's own read-only flag says nothing about its exporter:
+/// `memoryview(bytearray(...)).toreadonly()` is read-only, yet the bytearray
+/// behind it can still be written in place. Even an `mmap` opened with
+/// `ACCESS_READ` only maps a file that another process (or a writable
+/// mapping of the same file) can modify or truncate underneath it. Only
+/// C-contiguous views over a `bytes` object (`view.obj`) qualify; everything
+/// else must be copied by the caller.
+pub(crate) fn immutable_view_buffer(view: &Bound<'_, PyMemoryView>) -> Option<PyBuffer<u8>> {
+    let buf = PyBuffer::<u8>::get(view.as_any()).ok()?;
+    if !(buf.readonly() && buf.is_c_contiguous()) {
+        return None;
+    }
+    let obj = view.getattr("obj").ok()?;
+    obj.is_instance_of::<PyBytes>().then_some(buf)
+}
+
 /// A source of complete ISO 2709 record byte-slices, read one record at a
 /// time. Abstracts over the concrete input backends so the batching and
 /// parsing layer ([`crate::batched_reader::BatchedReader`]) is generic and
@@ -31,6 +50,13 @@ pub trait RecordByteSource: std::fmt::Debug {
     /// Backend kind for diagnostics: `"rust_file"`, `"cursor"`, or
     /// `"python_file"`.
     fn backend_kind(&self) -> &'static str;
+
+    /// Whether the source provably holds fewer bytes than a 24-byte leader,
+    /// so the next read can only be a clean end of stream. Streaming
+    /// sources cannot know without reading and keep the default `false`.
+    fn shorter_than_leader(&self, _py: Python<'_>) -> bool {
+        false
+    }
 }
 
 impl RecordByteSource for ReaderBackend {
@@ -38,6 +64,10 @@ impl RecordByteSource for ReaderBackend {
         self.read_next_bytes(py)
     }
 
+    fn shorter_than_leader(&self, py: Python<'_>) -> bool {
+        self.remaining_below_leader(py)
+    }
+
     fn backend_kind(&self) -> &'static str {
         self.backend_type()
     }
@@ -45,9 +75,10 @@ impl RecordByteSource for ReaderBackend {
 
 /// Unified backend interface for reading MARC records from different sources
 ///
-/// Supports 8 input types:
+/// Supports 9 input types:
 /// - str, pathlib.Path → `RustFile`
 /// - bytes → `PyBytesBuffer` (borrowed)
+/// - memoryview over bytes → `PyBufferView` (borrowed)
 /// - bytearray → `CursorBackend`
 /// - file object, `BytesIO`, socket.socket → `PythonFile`
 ///
@@ -78,6 +109,16 @@ enum BackendKind {
     /// the `"cursor"` backend kind for diagnostics, like `CursorBackend`.
     PyBytesBuffer { obj: Py<PyBytes>, pos: usize },
 
+    /// Zero-copy in-memory reads from a C-contiguous view over `bytes`.
+    /// Input: memoryview whose underlying object is a `bytes` (for example a
+    /// slice of one)
+    /// Like `PyBytesBuffer`, the held buffer view keeps the `bytes` alive and
+    /// records are sliced out of it under the GIL, so no whole-input copy is
+    /// taken. Other views (read-only ones over a bytearray, or over an `mmap`
+    /// whose file can change underneath it) fall through to the
+    /// `CursorBackend` snapshot. Reports `"cursor"`.
+    PyBufferView { buf: PyBuffer<u8>, pos: usize },
+
     /// In-memory reads from an owned byte buffer via `std::io::Cursor`
     /// Input: bytearray (a mutable buffer, copied to a snapshot at
     /// construction) and other buffer-like inputs that extract to `Vec<u8>`
@@ -98,9 +139,10 @@ impl ReaderBackend {
     /// 1. str → `RustFile`
     /// 2. pathlib.Path → `RustFile`
     /// 3. bytes → `PyBytesBuffer` (borrowed, no whole-buffer copy)
-    /// 4. bytearray (and other `Vec<u8>`-extractable buffers) → `CursorBackend`
-    /// 5. Object with .`read()` method → `PythonFile`
-    /// 6. Unknown type → `TypeError`
+    /// 4. memoryview over bytes → `PyBufferView` (borrowed)
+    /// 5. bytearray (and other `Vec<u8>`-extractable buffers) → `CursorBackend`
+    /// 6. Object with .`read()` method → `PythonFile`
+    /// 7. Unknown type → `TypeError`
     ///
     /// # Arguments
     /// * `source` - Python object (str, Path, bytes, bytearray, or file-like)
@@ -189,13 +231,24 @@ impl ReaderBackend {
             });
         }
 
-        // 4. Try bytearray (and other buffer-like inputs): a bytearray is
+        // 4. Try a memoryview over `bytes`: borrow its buffer for the life
+        // of the reader, as for `bytes`. Any other view (over a bytearray,
+        // or over an `mmap` whose file can be modified or truncated
+        // externally) could change mid-stream and falls through to the
+        // snapshot below.
+        if let Ok(view) = source.cast::<PyMemoryView>()
+            && let Some(buf) = immutable_view_buffer(view)
+        {
+            return Ok(BackendKind::PyBufferView { buf, pos: 0 });
+        }
+
+        // 5. Try bytearray (and other buffer-like inputs): a bytearray is
         // mutable, so snapshot it into an owned Vec at construction.
         if let Ok(bytes_data) = source.extract::<Vec<u8>>() {
             return Ok(BackendKind::CursorBackend(Cursor::new(bytes_data)));
         }
 
-        // 5. Try file-like object with .read() method
+        // 6. Try file-like object with .read() method
         let read_method = source.getattr("read");
         if let Ok(method) = read_method
             && method.is_callable()
@@ -207,7 +260,7 @@ impl ReaderBackend {
             )?));
         }
 
-        // 6. Unknown type - fail fast with descriptive error
+        // 7. Unknown type - fail fast with descriptive error
         let type_name = source.get_type().name()?;
         Err(pyo3::exceptions::PyTypeError::new_err(format!(
             "Unsupported input type: {type_name}. Supported types: str (file path), pathlib.Path, \
@@ -221,13 +274,36 @@ impl ReaderBackend {
     pub fn backend_type(&self) -> &'static str {
         match &self.kind {
             BackendKind::RustFile(_) => "rust_file",
-            // Both in-memory byte backends report "cursor"; the borrowed
-            // `bytes` path is an implementation detail of the same kind.
-            BackendKind::PyBytesBuffer { .. } | BackendKind::CursorBackend(_) => "cursor",
+            // All in-memory byte backends report "cursor"; the borrowed
+            // `bytes` and buffer-view paths are implementation details of
+            // the same kind.
+            BackendKind::PyBytesBuffer { .. }
+            | BackendKind::PyBufferView { .. }
+            | BackendKind::CursorBackend(_) => "cursor",
             BackendKind::PythonFile(_) => "python_file",
         }
     }
 
+    /// Whether an in-memory backend has fewer than 24 bytes left to read.
+    ///
+    /// A leader read over such a tail always ends in `UnexpectedEof`, which
+    /// `read_record_bytes_from_reader` reports as a clean EOF; answering it
+    /// up front lets the batched reader skip its batch allocation for
+    /// degenerate inputs. File backends always return `false`.
+    pub fn remaining_below_leader(&self, py: Python) -> bool {
+        match &self.kind {
+            BackendKind::PyBytesBuffer { obj, pos } => {
+                obj.bind(py).as_bytes().len().saturating_sub(*pos) < 24
+            },
+            BackendKind::PyBufferView { buf, pos } => buf.len_bytes().saturating_sub(*pos) < 24,
+            BackendKind::CursorBackend(cursor) => {
+                let len = cursor.get_ref().len() as u64;
+                len.saturating_sub(cursor.position()) < 24
+            },
+            BackendKind::RustFile(_) | BackendKind::PythonFile(_) => false,
+        }
+    }
+
     /// Read the next MARC record from this backend
     ///
     /// For `RustFile` and `CursorBackend`: reads directly without GIL
@@ -261,6 +337,22 @@ impl ReaderBackend {
                 *pos += consumed;
                 result
             },
+            BackendKind::PyBufferView { buf, pos } => {
+                // SAFETY: construction admitted only C-contiguous views over
+                // a `bytes` object, so `buf_ptr()` addresses `len_bytes()`
+                // initialized bytes whose contents cannot change. The
+                // `PyBuffer` holds the `bytes` alive, and the slice does not
+                // outlive this call.
+                let data = unsafe {
+                    std::slice::from_raw_parts(buf.buf_ptr().cast::<u8>(), buf.len_bytes())
+                };
+                let mut cursor = Cursor::new(&data[*pos..]);
+                let result = Self::read_record_bytes_from_reader(&mut cursor, recovery_mode);
+                let consumed = usize::try_from(cursor.position())
+                    .expect("cursor position is bounded by the borrowed slice length");
+                *pos += consumed;
+                result
+            },
             BackendKind::CursorBackend(cursor) => {
                 Self::read_record_bytes_from_reader(cursor, recovery_mode)
             },
@@ -114,6 +114,13 @@ impl<S: RecordByteSource> BatchedReader<S> {
     /// Read up to one batch of record bytes (GIL held), parse them all in a
     /// single `py.detach`, and enqueue the outcomes in source order.
     fn fill_batch(&mut self, py: Python<'_>) {
+        // A source too short to hold another leader can only read as a
+        // clean EOF; mark it exhausted before allocating the batch buffers.
+        if self.source.shorter_than_leader(py) {
+            self.eof = true;
+            return;
+        }
+
         // === Phase 1: read record bytes (GIL held) ===
         let mut batch_bytes: Vec<Arc<Vec<u8>>> = Vec::with_capacity(TARGET_BATCH_SIZE);
         let mut batch_byte_total = 0usize;
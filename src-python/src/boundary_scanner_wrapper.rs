@@ -4,6 +4,7 @@
 //! efficient MARC record boundary detection using SIMD-accelerated memchr.
 
 use mrrc::boundary_scanner::RecordBoundaryScanner as RustBoundaryScanner;
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
 
 /// Python wrapper for `RecordBoundaryScanner`.
@@ -106,6 +107,71 @@ impl PyRecordBoundaryScanner {
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
     }
 
+    /// Scan a buffer and write boundaries into a caller-supplied int64 buffer.
+    ///
+    /// Like [`scan_limited`](Self::scan_limited) with the limit set by the size
+    /// of `out`, but the boundaries are written as flat `offset, length` pairs
+    /// instead of being returned as a list of tuples, so no Python object is
+    /// created per record. `out` can be any writable, C-contiguous buffer of
+    /// 64-bit signed integers, such as `array.array("q", ...)` or a NumPy
+    /// `int64` array of shape `(n, 2)`; the same `out` can be reused across
+    /// calls.
+    ///
+    /// # Arguments
+    ///
+    /// * `data` - The bytes to scan
+    /// * `out` - Writable int64 buffer; holds (element count) // 2 boundaries,
+    ///   i.e. `out.size // 2` for a NumPy array or `out.nbytes // 16` for any
+    ///   buffer
+    ///
+    /// # Returns
+    ///
+    /// The number of boundaries written. Pair `i` occupies flat elements
+    /// `2 * i` (offset) and `2 * i + 1` (length), which is row `i` of an
+    /// `(n, 2)` array.
+    ///
+    /// # Raises
+    ///
+    /// Raises `ValueError` if the buffer is empty or no complete records are
+    /// found, or if `out` is read-only or not C-contiguous.
+    ///
+    /// # Example
+    ///
+    /// ```python
+    /// from array import array
+    ///
+    /// scanner = RecordBoundaryScanner()
+    /// out = array("q", bytes(8 * 2 * 1024))
+    /// count = scanner.scan_into(data, out)
+    /// boundaries = zip(out[0 : 2 * count : 2], out[1 : 2 * count : 2])
+    /// ```
+    fn scan_into(
+        &mut self,
+        py: Python<'_>,
+        data: &[u8],
+        out: &Bound<'_, PyAny>,
+    ) -> PyResult<usize> {
+        let buf = PyBuffer::<i64>::get(out)?;
+        let Some(cells) = buf.as_mut_slice(py) else {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "out must be a writable, C-contiguous int64 buffer",
+            ));
+        };
+        let boundaries = self
+            .inner
+            .scan(data)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+
+        let written = boundaries.len().min(cells.len() / 2);
+        for (pair, &(offset, length)) in cells.chunks_exact(2).zip(&boundaries) {
+            // Offsets and lengths index an in-memory buffer, so they are
+            // bounded by isize::MAX and always fit in an i64.
+            pair[0].set(i64::try_from(offset).expect("buffer offsets fit in i64"));
+            pair[1].set(i64::try_from(length).expect("record lengths fit in i64"));
+        }
+        Ok(written)
+    }
+
     /// Get the number of complete records in a buffer without parsing.
     ///
     /// This is useful for diagnostics and deciding batch sizes. It only counts
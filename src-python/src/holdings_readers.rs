@@ -6,10 +6,12 @@
 
 use crate::backend::FILE_READ_BUF_CAPACITY;
 use crate::reader_helpers;
+use crate::readers::interned_backend_kind;
 use crate::wrappers::PyHoldingsRecord;
 use mrrc::holdings_reader::HoldingsMarcReader;
 use mrrc::recovery::{RecoveryMode, ValidationLevel};
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 use std::fs::File;
 use std::io::{BufReader, Cursor};
 
@@ -178,6 +180,23 @@ impl PyHoldingsMARCReader {
         Ok(false)
     }
 
+    /// Return the backend type: "`rust_file`", "cursor", or "`python_file`"
+    ///
+    /// Same names as `MARCReader.backend_type`, so callers can check which
+    /// backend a source routed to without timing it.
+    #[getter]
+    fn backend_type<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyString>> {
+        let kind = match &self.backend {
+            Some(HoldingsReaderBackend::RustFile(_)) => "rust_file",
+            Some(HoldingsReaderBackend::CursorBackend(_)) => "cursor",
+            Some(HoldingsReaderBackend::PythonFile(_)) => "python_file",
+            None => {
+                return Err(pyo3::exceptions::PyRuntimeError::new_err("Reader consumed"));
+            },
+        };
+        Ok(interned_backend_kind(py, kind))
+    }
+
     pub fn __repr__(&self) -> String {
         match &self.backend {
             None => "HoldingsMARCReader(closed)".to_string(),
@@ -4,7 +4,7 @@
 //! batch reading with backpressure management from Python code.
 
 use crate::wrappers::PyRecord;
-use mrrc::producer_consumer_pipeline::{PipelineConfig, ProducerConsumerPipeline};
+use mrrc::producer_consumer_pipeline::{PipelineConfig, PipelineResult, ProducerConsumerPipeline};
 use pyo3::exceptions::PyStopIteration;
 use pyo3::prelude::*;
 
@@ -169,6 +169,37 @@ impl PyProducerConsumerPipeline {
         Ok(record.map(PyRecord::from))
     }
 
+    /// Drain the pipeline and return how many records it produced.
+    ///
+    /// Consumes every remaining record in Rust with the GIL released for
+    /// the whole drain, without converting any record to a Python object.
+    ///
+    /// # Raises
+    ///
+    /// `RuntimeError` if the producer thread fails.
+    ///
+    /// # Example
+    ///
+    /// ```python
+    /// pipeline = ProducerConsumerPipeline.from_file("records.mrc")
+    /// print(f"{pipeline.count()} records")
+    /// ```
+    pub fn count(&mut self, py: Python<'_>) -> PyResult<usize> {
+        let pipeline = self
+            .inner
+            .as_ref()
+            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Pipeline closed"))?;
+
+        let counted: PipelineResult<usize> = py.detach(|| {
+            let mut count = 0usize;
+            while pipeline.next()?.is_some() {
+                count += 1;
+            }
+            Ok(count)
+        });
+        counted.map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
+    }
+
     /// Iterate over all records in the pipeline.
     ///
     /// Consumes the pipeline, yielding records sequentially.
@@ -3,16 +3,54 @@
 //! Exposes [`parse_batch_parallel`] as a Python function, allowing
 //! parallel MARC record parsing from Python code.
 
+use crate::backend::immutable_view_buffer;
 use crate::wrappers::PyRecord;
 use mrrc::rayon_parser_pool;
 use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyMemoryView};
+
+/// Run `parse` over the bytes of `buffer` with the GIL released.
+///
+/// Immutable inputs are borrowed in place: a `bytes` object, or a
+/// C-contiguous memoryview over one. Their contents cannot change while the
+/// GIL is released, and the caller's reference keeps them alive for the
+/// whole call. Anything else is copied into an owned `Vec<u8>` first: a
+/// `bytearray` (or any view over one) can be written or resized by another
+/// thread mid-parse, and an `mmap`'s file can be modified or truncated by
+/// another process or mapping.
+fn parse_detached<T: Send>(
+    py: Python<'_>,
+    buffer: &Bound<'_, PyAny>,
+    parse: impl FnOnce(&[u8]) -> T + Send,
+) -> PyResult<T> {
+    if let Ok(bytes) = buffer.cast::<PyBytes>() {
+        let data = bytes.as_bytes();
+        return Ok(py.detach(|| parse(data)));
+    }
+
+    if let Ok(view) = buffer.cast::<PyMemoryView>()
+        && let Some(buf) = immutable_view_buffer(view)
+    {
+        // SAFETY: only C-contiguous views over a `bytes` object reach here,
+        // so `buf_ptr()` addresses `len_bytes()` initialized bytes that
+        // nothing can modify. `buf` holds the `bytes` alive and outlives the
+        // detached parse that borrows the slice.
+        let data =
+            unsafe { std::slice::from_raw_parts(buf.buf_ptr().cast::<u8>(), buf.len_bytes()) };
+        return Ok(py.detach(|| parse(data)));
+    }
+
+    let owned: Vec<u8> = buffer.extract()?;
+    Ok(py.detach(|| parse(&owned)))
+}
 
 /// Parse a batch of MARC record boundaries in parallel using Rayon.
 ///
 /// # Arguments
 ///
 /// * `boundaries` - List of (offset, length) tuples identifying record boundaries
-/// * `buffer` - The complete binary buffer containing all records (bytes or bytearray)
+/// * `buffer` - The complete binary buffer containing all records (bytes, bytearray, or
+///   memoryview; `bytes` and views over `bytes` are parsed in place without a copy)
 ///
 /// # Returns
 ///
@@ -47,18 +85,15 @@ use pyo3::prelude::*;
 pub fn parse_batch_parallel(
     py: Python<'_>,
     boundaries: Vec<(usize, usize)>,
-    buffer: Vec<u8>,
+    buffer: &Bound<'_, PyAny>,
 ) -> PyResult<Vec<PyRecord>> {
     // Release the GIL for the Rayon parallel parse so other Python threads can
-    // run — otherwise the whole point (parallelism) is defeated. `buffer` is an
-    // owned `Vec<u8>` (copied at extraction), not a borrow into Python memory:
-    // a borrowed `&[u8]` into a `bytearray` could be mutated or freed by another
-    // thread while the GIL is released, which would be unsound here.
-    let records = py
-        .detach(|| rayon_parser_pool::parse_batch_parallel(&boundaries, &buffer).map_err(Box::new))
-        .map_err(|e| {
-            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Parse error: {e}"))
-        })?;
+    // run — otherwise the whole point (parallelism) is defeated. Only buffers
+    // nothing can mutate are borrowed across the release (see `parse_detached`).
+    let records = parse_detached(py, buffer, |data| {
+        rayon_parser_pool::parse_batch_parallel(&boundaries, data).map_err(Box::new)
+    })?
+    .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Parse error: {e}")))?;
 
     // Convert Rust records to PyRecord wrappers (GIL re-acquired after detach)
     Ok(records.into_iter().map(PyRecord::from).collect())
@@ -97,19 +132,15 @@ pub fn parse_batch_parallel(
 pub fn parse_batch_parallel_limited(
     py: Python<'_>,
     boundaries: Vec<(usize, usize)>,
-    buffer: Vec<u8>,
+    buffer: &Bound<'_, PyAny>,
     limit: usize,
 ) -> PyResult<Vec<PyRecord>> {
-    // Release the GIL for the parallel parse (see `parse_batch_parallel` for
-    // why `buffer` must be owned, not a borrow into Python memory).
-    let records = py
-        .detach(|| {
-            rayon_parser_pool::parse_batch_parallel_limited(&boundaries, &buffer, limit)
-                .map_err(Box::new)
-        })
-        .map_err(|e| {
-            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Parse error: {e}"))
-        })?;
+    // Release the GIL for the parallel parse (see `parse_detached` for which
+    // buffers are borrowed and which are copied).
+    let records = parse_detached(py, buffer, |data| {
+        rayon_parser_pool::parse_batch_parallel_limited(&boundaries, data, limit).map_err(Box::new)
+    })?
+    .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Parse error: {e}")))?;
 
     // Convert to PyRecord (GIL re-acquired after detach)
     Ok(records.into_iter().map(PyRecord::from).collect())
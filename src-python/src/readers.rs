@@ -8,7 +8,9 @@
 use crate::backend::ReaderBackend;
 use crate::batched_reader::{BatchedReader, RecordOutcome};
 use crate::wrappers::PyRecord;
+use pyo3::intern;
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 
 /// Python wrapper for `MarcReader` with efficient GIL management
 ///
@@ -236,17 +238,76 @@ impl PyMARCReader {
 
         match slf.apply_outcome(outcome)? {
             Some(record) => Ok(record),
-            None => Err(pyo3::exceptions::PyRuntimeError::new_err(
-                "Parser returned None for complete record",
-            )),
+            None => Err(parser_returned_none()),
         }
     }
 
+    /// Count the remaining records without building Python `Record` objects
+    ///
+    /// Reads and parses exactly as iteration does — same batching, one GIL
+    /// release per batch, same errors — but never converts a parsed record
+    /// to a `PyRecord`, so no Python object is allocated per record.
+    /// Consumes the reader.
+    ///
+    /// # Arguments
+    /// * `skip_failed` - Skip records whose parse fails instead of raising.
+    ///   Skipped records are not counted. Source read errors always raise.
+    #[pyo3(signature = (*, skip_failed = false))]
+    pub fn count_records(&mut self, py: Python<'_>, skip_failed: bool) -> PyResult<usize> {
+        let mut count = 0usize;
+        while let Some(reader) = self.reader.as_mut() {
+            let Some(outcome) = reader.next_record(py) else {
+                self.reader = None;
+                break;
+            };
+            if skip_failed && matches!(outcome, RecordOutcome::ParseFailed { .. }) {
+                continue;
+            }
+            if self.accept_outcome(outcome)?.is_none() {
+                return Err(parser_returned_none());
+            }
+            count += 1;
+        }
+        Ok(count)
+    }
+
+    /// Read all remaining records into a list in one call
+    ///
+    /// Reads and parses exactly as iteration does — same batching, one GIL
+    /// release per batch, same errors — but collects the records without a
+    /// Python-level `__next__` call per record. Consumes the reader.
+    ///
+    /// # Arguments
+    /// * `skip_failed` - Skip records whose parse fails instead of raising.
+    ///   Source read errors always raise.
+    #[pyo3(signature = (*, skip_failed = false))]
+    pub fn drain(&mut self, py: Python<'_>, skip_failed: bool) -> PyResult<Vec<PyRecord>> {
+        let mut records = Vec::new();
+        while let Some(reader) = self.reader.as_mut() {
+            let Some(outcome) = reader.next_record(py) else {
+                self.reader = None;
+                break;
+            };
+            if skip_failed && matches!(outcome, RecordOutcome::ParseFailed { .. }) {
+                continue;
+            }
+            let record = self
+                .apply_outcome(outcome)?
+                .ok_or_else(parser_returned_none)?;
+            records.push(record);
+        }
+        Ok(records)
+    }
+
     /// Return the backend type: "`rust_file`", "cursor", or "`python_file`"
+    ///
+    /// The name is returned as an interned Python string, so repeated
+    /// calls allocate nothing and equality checks against the same
+    /// literal can short-circuit on identity.
     #[getter]
-    fn backend_type(&self) -> PyResult<String> {
+    fn backend_type<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyString>> {
         match &self.reader {
-            Some(reader) => Ok(reader.backend_kind().to_string()),
+            Some(reader) => Ok(interned_backend_kind(py, reader.backend_kind())),
             None => Err(pyo3::exceptions::PyRuntimeError::new_err("Reader consumed")),
         }
     }
@@ -260,15 +321,42 @@ impl PyMARCReader {
     }
 }
 
+/// Interned Python string for a backend kind name. Each known kind is
+/// interned once per interpreter via `intern!`; any other name falls back
+/// to `PyString::intern`.
+pub(crate) fn interned_backend_kind<'py>(
+    py: Python<'py>,
+    kind: &'static str,
+) -> Bound<'py, PyString> {
+    match kind {
+        "rust_file" => intern!(py, "rust_file").clone(),
+        "cursor" => intern!(py, "cursor").clone(),
+        "python_file" => intern!(py, "python_file").clone(),
+        other => PyString::intern(py, other),
+    }
+}
+
+/// The error iteration raises when the parser produces no record for a
+/// complete record slice.
+fn parser_returned_none() -> PyErr {
+    pyo3::exceptions::PyRuntimeError::new_err("Parser returned None for complete record")
+}
+
 impl PyMARCReader {
     /// Turn a queued [`RecordOutcome`] into the value `__next__` /
     /// `read_record` return. `Ok(Some(record))` yields a record;
     /// `Ok(None)` means the parser produced no record for a complete slice
     /// (callers diverge: EOF for `read_record`, a runtime error for
-    /// `__next__`); `Err` raises. `current_chunk` is updated for every
-    /// outcome that carries bytes (success or failure), matching the prior
-    /// per-record stash; a source-read error leaves it unchanged.
+    /// `__next__`); `Err` raises.
     fn apply_outcome(&mut self, outcome: RecordOutcome) -> PyResult<Option<PyRecord>> {
+        Ok(self.accept_outcome(outcome)?.map(PyRecord::from))
+    }
+
+    /// Account for a queued [`RecordOutcome`] without converting it to a
+    /// Python object. `current_chunk` is updated for every outcome that
+    /// carries bytes (success or failure), matching the prior per-record
+    /// stash; a source-read error leaves it unchanged.
+    fn accept_outcome(&mut self, outcome: RecordOutcome) -> PyResult<Option<mrrc::Record>> {
         match outcome {
             RecordOutcome::Parsed { bytes, record } => {
                 self.last_chunk = Some(bytes);
@@ -280,7 +368,7 @@ impl PyMARCReader {
                     return Err(crate::error::marc_error_to_py_err(*e));
                 }
                 self.records_yielded = self.records_yielded.saturating_add(1);
-                Ok(Some(PyRecord::from(record)))
+                Ok(Some(record))
             },
             RecordOutcome::ParseFailed { bytes, error } => {
                 self.last_chunk = Some(bytes);
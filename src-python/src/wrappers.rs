@@ -2,6 +2,8 @@
 
 use mrrc::{AuthorityRecord, Field, HoldingsRecord, Leader, Record, RecordHelpers, Subfield};
 use pyo3::prelude::*;
+use pyo3::sync::PyOnceLock;
+use pyo3::types::{PyByteArray, PyString};
 
 /// Python wrapper for a MARC Leader (24-byte record header)
 ///
@@ -403,6 +405,56 @@ impl PySubfield {
     }
 }
 
+/// A subfield accepted by the `Field` constructor: a `Subfield` object or
+/// a plain `(code, value)` pair, so callers can build a field in one call
+/// without constructing a `Subfield` per entry.
+#[derive(FromPyObject, Debug)]
+pub enum SubfieldArg {
+    /// A `Subfield` object.
+    Subfield(PySubfield),
+    /// A `(code, value)` tuple.
+    Pair(String, String),
+}
+
+impl SubfieldArg {
+    fn into_subfield(self) -> PyResult<Subfield> {
+        match self {
+            SubfieldArg::Subfield(sf) => Ok(sf.inner),
+            SubfieldArg::Pair(code, value) => {
+                let Some(code) = code.chars().next() else {
+                    return Err(pyo3::exceptions::PyValueError::new_err(
+                        "Subfield code cannot be empty",
+                    ));
+                };
+                Ok(Subfield { code, value })
+            },
+        }
+    }
+}
+
+/// Interned Python strings for the numeric tags `"000"`..=`"999"`, built once
+/// per interpreter.
+static NUMERIC_TAGS: PyOnceLock<Vec<Py<PyString>>> = PyOnceLock::new();
+
+/// Python string for a field tag. Numeric tags share one interned string
+/// each, so repeated `Field.tag` reads neither allocate nor rehash; any other
+/// tag gets a fresh string.
+fn tag_string<'py>(py: Python<'py>, tag: &str) -> Bound<'py, PyString> {
+    match *tag.as_bytes() {
+        [a @ b'0'..=b'9', b @ b'0'..=b'9', c @ b'0'..=b'9'] => {
+            let index =
+                usize::from(a - b'0') * 100 + usize::from(b - b'0') * 10 + usize::from(c - b'0');
+            let tags = NUMERIC_TAGS.get_or_init(py, || {
+                (0..1000)
+                    .map(|i| PyString::intern(py, &format!("{i:03}")).unbind())
+                    .collect()
+            });
+            tags[index].bind(py).clone()
+        },
+        _ => PyString::new(py, tag),
+    }
+}
+
 /// Python wrapper for a Field
 ///
 /// A MARC field consists of a 3-character tag, two indicators, and one or more subfields.
@@ -430,7 +482,7 @@ impl PyField {
     /// * `tag` - 3-character field tag (e.g., '245')
     /// * `indicator1` - First indicator (default: '0')
     /// * `indicator2` - Second indicator (default: '0')
-    /// * `subfields` - Optional list of Subfield objects to initialize
+    /// * `subfields` - Optional list of Subfield objects or `(code, value)` pairs
     /// * `indicators` - Optional list [ind1, ind2] (alternative to positional args)
     #[new]
     #[pyo3(signature = (tag, indicator1=None, indicator2=None, *, subfields=None, indicators=None))]
@@ -439,7 +491,7 @@ impl PyField {
         tag: &str,
         indicator1: Option<&str>,
         indicator2: Option<&str>,
-        subfields: Option<Vec<PySubfield>>,
+        subfields: Option<Vec<SubfieldArg>>,
         indicators: Option<Py<PyAny>>,
     ) -> PyResult<Self> {
         if tag.len() != 3 {
@@ -473,9 +525,11 @@ impl PyField {
             )
         };
 
-        // Convert PySubfield objects to inner Subfield objects
+        // Convert Subfield objects and (code, value) pairs to inner Subfields
         let sfs: smallvec::SmallVec<[_; 4]> = if let Some(sfs) = subfields {
-            sfs.iter().map(|psf| psf.inner.clone()).collect()
+            sfs.into_iter()
+                .map(SubfieldArg::into_subfield)
+                .collect::<PyResult<_>>()?
         } else {
             smallvec::SmallVec::new()
         };
@@ -492,8 +546,8 @@ impl PyField {
 
     /// Field tag (3 digits)
     #[getter]
-    pub fn tag(&self) -> String {
-        self.inner.tag.clone()
+    pub fn tag<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        tag_string(py, &self.inner.tag)
     }
 
     /// First indicator
@@ -546,6 +600,11 @@ impl PyField {
             .collect()
     }
 
+    /// Get the subfield codes, in order, without building Subfield objects
+    pub fn subfield_codes(&self) -> Vec<char> {
+        self.inner.subfields.iter().map(|sf| sf.code).collect()
+    }
+
     /// Get subfields by code
     pub fn subfields_by_code(&self, code: &str) -> PyResult<Vec<String>> {
         if code.is_empty() {
@@ -556,10 +615,8 @@ impl PyField {
         let code_char = code.chars().next().unwrap();
         Ok(self
             .inner
-            .subfields
-            .iter()
-            .filter(|sf| sf.code == code_char)
-            .map(|sf| sf.value.clone())
+            .subfields_by_code(code_char)
+            .map(str::to_owned)
             .collect())
     }
 
@@ -614,6 +671,10 @@ impl PyField {
     }
 }
 
+/// A data-field spec accepted by [`PyRecord::build`]:
+/// `(tag, indicator1, indicator2, [(code, value), ...])`.
+type DataFieldSpec = (String, String, String, Vec<(String, String)>);
+
 /// Python wrapper for a Record
 ///
 /// A MARC bibliographic record is the fundamental unit of MARC data.
@@ -665,6 +726,59 @@ impl PyRecord {
         PyRecord::from(Record::new(leader.inner.clone()))
     }
 
+    /// Build a record from plain field specs in a single call
+    ///
+    /// # Arguments
+    /// * `leader` - Record leader
+    /// * `control_fields` - `(tag, value)` pairs, added in order
+    /// * `data_fields` - `(tag, ind1, ind2, [(code, value), ...])` tuples,
+    ///   added in order
+    ///
+    /// Fields are constructed directly in Rust and moved into the record,
+    /// replacing the per-field `Field(...)` / `add_subfield` / `add_field`
+    /// round trips. Validation matches those calls: tags must be 3
+    /// characters, subfield codes non-empty, and an empty indicator
+    /// defaults to '0' as in `Field(...)`.
+    #[staticmethod]
+    pub fn build(
+        leader: &PyLeader,
+        control_fields: Vec<(String, String)>,
+        data_fields: Vec<DataFieldSpec>,
+    ) -> PyResult<Self> {
+        let mut record = Record::new(leader.inner.clone());
+        for (tag, value) in control_fields {
+            if tag.len() != 3 {
+                return Err(pyo3::exceptions::PyValueError::new_err(
+                    "Tag must be exactly 3 characters",
+                ));
+            }
+            record.add_control_field(tag, value);
+        }
+        for (tag, ind1, ind2, subfields) in data_fields {
+            if tag.len() != 3 {
+                return Err(pyo3::exceptions::PyValueError::new_err(
+                    "Tag must be exactly 3 characters",
+                ));
+            }
+            let mut field = Field::new(
+                tag,
+                ind1.chars().next().unwrap_or('0'),
+                ind2.chars().next().unwrap_or('0'),
+            );
+            field.subfields.reserve(subfields.len());
+            for (code, value) in subfields {
+                let Some(code) = code.chars().next() else {
+                    return Err(pyo3::exceptions::PyValueError::new_err(
+                        "Subfield code cannot be empty",
+                    ));
+                };
+                field.subfields.push(Subfield { code, value });
+            }
+            record.add_field(field);
+        }
+        Ok(PyRecord::from(record))
+    }
+
     /// The record leader (attribute, matching pymarc's record.leader)
     #[getter]
     pub fn leader(&self) -> PyLeader {
@@ -713,6 +827,16 @@ impl PyRecord {
         self.inner.add_field(field.inner.clone());
     }
 
+    /// Add several data fields in one call, in order
+    ///
+    /// Equivalent to calling `add_field` for each field, with a single
+    /// Python/Rust crossing for the whole batch.
+    pub fn add_fields(&mut self, fields: Vec<PyRef<'_, PyField>>) {
+        for field in fields {
+            self.inner.add_field(field.inner.clone());
+        }
+    }
+
     /// Get the first field with a given tag (pymarc compatibility)
     pub fn get_field(&self, tag: &str) -> Option<PyField> {
         self.inner
@@ -1249,6 +1373,32 @@ impl PyRecord {
             .collect()
     }
 
+    /// Get fields matching each of several `SubfieldPatternQuery` objects.
+    ///
+    /// Evaluates every query in one call, so a batch of patterns costs one
+    /// crossing into Rust per record instead of one per pattern.
+    ///
+    /// Args:
+    ///     queries: `SubfieldPatternQuery` objects to evaluate.
+    ///
+    /// Returns:
+    ///     One list of matching Field objects per query, in query order.
+    ///
+    /// Example:
+    ///     >>> isbn13, older = `record.fields_matching_patterns([`
+    ///     ...     mrrc.SubfieldPatternQuery("020", "a", r"^97\[89\]-"),
+    ///     ...     mrrc.SubfieldPatternQuery("260", "c", r"^19"),
+    ///     ... ])
+    pub fn fields_matching_patterns(
+        &self,
+        queries: Vec<PyRef<'_, crate::query::PySubfieldPatternQuery>>,
+    ) -> Vec<Vec<PyField>> {
+        queries
+            .iter()
+            .map(|query| self.fields_matching_pattern(query))
+            .collect()
+    }
+
     /// Get fields matching a `SubfieldValueQuery` (exact or partial string matching).
     ///
     /// This method finds fields where a specific subfield's value matches
@@ -1305,6 +1455,19 @@ impl PyRecord {
         marcxml::record_to_marcxml(&self.inner).map_err(crate::error::marc_error_to_py_err)
     }
 
+    /// Convert record to MARCXML as UTF-8 encoded bytes
+    ///
+    /// Same document as `to_xml`, returned without decoding it into a
+    /// Python `str` — suited to XML parsers and binary files.
+    ///
+    /// # Example
+    /// ```python
+    /// xml_bytes = record.to_xml_bytes()
+    /// ```
+    pub fn to_xml_bytes(&self) -> PyResult<Vec<u8>> {
+        self.to_xml().map(String::into_bytes)
+    }
+
     /// Convert record to MARCJSON format
     ///
     /// # Example
@@ -1393,6 +1556,37 @@ impl PyRecord {
         Ok(buffer)
     }
 
+    /// Append the record's MARC21 (ISO 2709) bytes to a caller-owned bytearray
+    ///
+    /// Serializing many records into one `bytearray` replaces one `bytes`
+    /// allocation per record with amortized growth of a single buffer.
+    ///
+    /// # Returns
+    /// Number of bytes appended
+    ///
+    /// # Errors
+    /// `BufferError` if the bytearray cannot be resized because it is
+    /// exported (for example through a live `memoryview`).
+    ///
+    /// # Example
+    /// ```python
+    /// buf = bytearray()
+    /// for record in records:
+    ///     record.write_marc21(buf)
+    /// ```
+    pub fn write_marc21(&self, out: &Bound<'_, PyByteArray>) -> PyResult<usize> {
+        let encoded = self.to_marc21()?;
+        let start = out.len();
+        out.resize(start + encoded.len())?;
+        // SAFETY: the GIL is held and no Python code runs between the
+        // resize above and this copy, so nothing can reallocate or resize
+        // the bytearray while the mutable slice is alive.
+        unsafe {
+            out.as_bytes_mut()[start..].copy_from_slice(&encoded);
+        }
+        Ok(encoded.len())
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "<Record type={} fields={}>",
@@ -1411,6 +1605,42 @@ impl PyRecord {
             && self.inner.fields == other.inner.fields
     }
 
+    /// True if the record has a control or data field with this tag
+    ///
+    /// Looks the tag up in place, without cloning a field to return it.
+    fn __contains__(&self, tag: &str) -> bool {
+        self.inner.fields.get(tag).is_some_and(|f| !f.is_empty())
+            || self
+                .inner
+                .control_fields
+                .get(tag)
+                .is_some_and(|v| !v.is_empty())
+    }
+
+    /// Compare control and data fields in order, ignoring the leader
+    ///
+    /// Backs the Python wrapper's `Record.__eq__`, replacing a walk over
+    /// per-field and per-subfield wrapper objects. Comparing a record with
+    /// itself returns immediately.
+    pub fn fields_equal(&self, other: &PyRecord) -> bool {
+        if std::ptr::eq(self, other) {
+            return true;
+        }
+        let control = |r: &PyRecord| {
+            r.inner
+                .control_fields
+                .iter()
+                .flat_map(|(tag, values)| values.iter().map(move |value| (tag, value)))
+                .collect::<Vec<_>>()
+        };
+        self.inner
+            .fields
+            .values()
+            .flatten()
+            .eq(other.inner.fields.values().flatten())
+            && control(self) == control(other)
+    }
+
     /// Return an independent deep copy (supports Python's ``copy.deepcopy``).
     /// Generation resets to 0; the clone owns its data with no live handles.
     fn __deepcopy__(&self, _memo: Bound<'_, PyAny>) -> PyRecord {
@@ -179,42 +179,55 @@ impl PyMARCWriter {
 
         // ===== PHASE 3: Write bytes to backend (GIL re-acquired) =====
         // GIL is automatically re-acquired when exiting detach() block
-        // Dispatch to the appropriate backend for I/O
-        match &mut self.backend {
-            Some(WriterBackend::PythonFile { file_obj }) => {
-                // PythonFile backend: requires GIL (calls Python .write() method)
-                // GIL is held here, safe to call Python methods
-                let file_ref = file_obj.bind(py);
-                let write_method = file_ref.getattr("write").map_err(|e| {
-                    pyo3::exceptions::PyRuntimeError::new_err(format!(
-                        "File object has no write method: {e}"
-                    ))
-                })?;
+        self.write_to_backend(py, record_bytes)
+    }
 
-                write_method.call1((record_bytes,)).map_err(|e| {
-                    pyo3::exceptions::PyRuntimeError::new_err(format!(
-                        "Failed to write record bytes: {e}"
-                    ))
-                })?;
-            },
-            Some(WriterBackend::RustFile { writer }) => {
-                // RustFile backend: no GIL needed (pure Rust I/O)
-                // GIL is held but not used - could be released further if needed
-                use std::io::Write;
-                writer.write_all(&record_bytes).map_err(|e| {
-                    pyo3::exceptions::PyIOError::new_err(format!(
-                        "Failed to write record bytes: {e}"
-                    ))
-                })?;
-            },
-            None => {
-                return Err(pyo3::exceptions::PyRuntimeError::new_err(
-                    "Writer backend not initialized",
-                ));
-            },
+    /// Write many records with one GIL release for the whole batch
+    ///
+    /// Same three phases as `write_record`, applied once per call instead
+    /// of once per record:
+    /// - **Phase 1 (GIL held):** Clone each record out of its `PyRecord`
+    /// - **Phase 2 (GIL released):** Serialize every record into one buffer
+    /// - **Phase 3 (GIL held):** Hand the buffer to the backend in one write
+    ///
+    /// The batch is all-or-nothing: if any record fails to serialize,
+    /// nothing from this call is written.
+    ///
+    /// # Returns
+    /// Number of records written
+    ///
+    /// # Errors
+    /// Same as `write_record`, plus `TypeError` if an item is not a `Record`
+    pub fn write_records(&mut self, records: &Bound<'_, PyAny>) -> PyResult<usize> {
+        if self.closed {
+            return Err(pyo3::exceptions::PyRuntimeError::new_err(
+                "Writer has been closed",
+            ));
         }
+        let py = records.py();
 
-        Ok(())
+        // ===== PHASE 1: Extract record data (GIL held) =====
+        let mut batch: Vec<mrrc::Record> = Vec::new();
+        for item in records.try_iter()? {
+            let record = item?.extract::<PyRef<'_, PyRecord>>()?;
+            batch.push(record.inner.clone());
+        }
+
+        // ===== PHASE 2: Serialize the whole batch (GIL released) =====
+        let serialize_result: Result<Vec<u8>, Box<mrrc::MarcError>> = py.detach(|| {
+            let mut buffer = Vec::new();
+            let mut writer = MarcWriter::new(&mut buffer);
+            for record in &batch {
+                writer.write_record(record).map_err(Box::new)?;
+            }
+            Ok(buffer)
+        });
+        let batch_bytes: Vec<u8> =
+            serialize_result.map_err(|e| crate::error::marc_error_to_py_err(*e))?;
+
+        // ===== PHASE 3: Write bytes to backend (GIL re-acquired) =====
+        self.write_to_backend(py, batch_bytes)?;
+        Ok(batch.len())
     }
 
     /// Alias for `write_record` (for pymarc compatibility)
@@ -280,3 +293,47 @@ impl PyMARCWriter {
         }
     }
 }
+
+impl PyMARCWriter {
+    /// Phase 3 of a write: hand serialized record bytes to the backend.
+    ///
+    /// `PythonFile` calls the object's `.write()` (GIL held); `RustFile`
+    /// writes through the Rust `BufWriter`.
+    fn write_to_backend(&mut self, py: Python<'_>, record_bytes: Vec<u8>) -> PyResult<()> {
+        match &mut self.backend {
+            Some(WriterBackend::PythonFile { file_obj }) => {
+                // PythonFile backend: requires GIL (calls Python .write() method)
+                // GIL is held here, safe to call Python methods
+                let file_ref = file_obj.bind(py);
+                let write_method = file_ref.getattr("write").map_err(|e| {
+                    pyo3::exceptions::PyRuntimeError::new_err(format!(
+                        "File object has no write method: {e}"
+                    ))
+                })?;
+
+                write_method.call1((record_bytes,)).map_err(|e| {
+                    pyo3::exceptions::PyRuntimeError::new_err(format!(
+                        "Failed to write record bytes: {e}"
+                    ))
+                })?;
+            },
+            Some(WriterBackend::RustFile { writer }) => {
+                // RustFile backend: no GIL needed (pure Rust I/O)
+                // GIL is held but not used - could be released further if needed
+                use std::io::Write;
+                writer.write_all(&record_bytes).map_err(|e| {
+                    pyo3::exceptions::PyIOError::new_err(format!(
+                        "Failed to write record bytes: {e}"
+                    ))
+                })?;
+            },
+            None => {
+                return Err(pyo3::exceptions::PyRuntimeError::new_err(
+                    "Writer backend not initialized",
+                ));
+            },
+        }
+
+        Ok(())
+    }
+}
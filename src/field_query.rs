@@ -40,6 +40,82 @@
 
 use crate::record::Field;
 use regex::Regex;
+use std::collections::HashMap;
+use std::sync::{LazyLock, Mutex, PoisonError};
+
+/// Most distinct patterns [`compile_pattern`] keeps; the cache is cleared
+/// when it fills, as Python's `re` module does.
+const PATTERN_CACHE_CAPACITY: usize = 512;
+
+/// Compiled regexes keyed by pattern string, shared by every
+/// [`SubfieldPatternQuery`] built from the same pattern.
+static PATTERN_CACHE: LazyLock<Mutex<HashMap<String, Regex>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+/// Compile `pattern`, reusing an earlier compilation of the same string.
+///
+/// A `Regex` clone shares the compiled program, so a cache hit skips
+/// compilation entirely. Invalid patterns are not cached.
+fn compile_pattern(pattern: &str) -> Result<Regex, regex::Error> {
+    if let Some(regex) = PATTERN_CACHE
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+        .get(pattern)
+    {
+        return Ok(regex.clone());
+    }
+
+    let regex = Regex::new(pattern)?;
+    let mut cache = PATTERN_CACHE.lock().unwrap_or_else(PoisonError::into_inner);
+    if cache.len() >= PATTERN_CACHE_CAPACITY {
+        cache.clear();
+    }
+    cache.insert(pattern.to_owned(), regex.clone());
+    Ok(regex)
+}
+
+/// Whether `field`'s indicators pass the filters, where `None` matches any.
+///
+/// Both comparisons are always evaluated and combined with a non-short-circuit
+/// `&`, so the check is two flat compares rather than a chain of branches.
+pub(crate) fn indicators_match(
+    field: &Field,
+    indicator1: Option<char>,
+    indicator2: Option<char>,
+) -> bool {
+    indicator1.is_none_or(|ind| field.indicator1 == ind)
+        & indicator2.is_none_or(|ind| field.indicator2 == ind)
+}
+
+/// Whether `field` has a subfield for every code in `required`.
+///
+/// Two or more ASCII codes (every standard MARC subfield code) are checked
+/// in a single pass over the subfields, collecting the codes seen into a
+/// 128-bit presence mask, instead of one scan of the subfields per code.
+fn has_all_subfields(field: &Field, required: &[char]) -> bool {
+    match required {
+        [] => true,
+        [code] => field.get_subfield(*code).is_some(),
+        _ if required.iter().all(char::is_ascii) => {
+            let wanted = required
+                .iter()
+                .fold(0u128, |mask, &code| mask | 1 << u32::from(code));
+            let mut seen = 0u128;
+            for subfield in &field.subfields {
+                if subfield.code.is_ascii() {
+                    seen |= 1 << u32::from(subfield.code);
+                    if seen & wanted == wanted {
+                        return true;
+                    }
+                }
+            }
+            false
+        },
+        _ => required
+            .iter()
+            .all(|&code| field.get_subfield(code).is_some()),
+    }
+}
 
 /// A query builder for finding fields matching complex criteria.
 ///
@@ -165,28 +241,8 @@ impl FieldQuery {
             return false;
         }
 
-        // Check first indicator
-        if let Some(ind1) = self.indicator1
-            && field.indicator1 != ind1
-        {
-            return false;
-        }
-
-        // Check second indicator
-        if let Some(ind2) = self.indicator2
-            && field.indicator2 != ind2
-        {
-            return false;
-        }
-
-        // Check required subfields
-        for &required_code in &self.required_subfields {
-            if field.get_subfield(required_code).is_none() {
-                return false;
-            }
-        }
-
-        true
+        indicators_match(field, self.indicator1, self.indicator2)
+            && has_all_subfields(field, &self.required_subfields)
     }
 }
 
@@ -217,29 +273,16 @@ impl TagRangeQuery {
     /// Check if a field matches this range query.
     #[must_use]
     pub fn matches(&self, field: &Field) -> bool {
-        if !self.tag_in_range(&field.tag) {
-            return false;
-        }
-
-        if let Some(ind1) = self.indicator1
-            && field.indicator1 != ind1
-        {
-            return false;
-        }
-
-        if let Some(ind2) = self.indicator2
-            && field.indicator2 != ind2
-        {
-            return false;
-        }
-
-        for &required_code in &self.required_subfields {
-            if field.get_subfield(required_code).is_none() {
-                return false;
-            }
-        }
+        self.tag_in_range(&field.tag) && self.matches_criteria(field)
+    }
 
-        true
+    /// Check the indicator and subfield criteria, ignoring the tag.
+    ///
+    /// Used once the tag range has already been settled for a whole tag
+    /// bucket, so it is not re-checked field by field.
+    pub(crate) fn matches_criteria(&self, field: &Field) -> bool {
+        indicators_match(field, self.indicator1, self.indicator2)
+            && has_all_subfields(field, &self.required_subfields)
     }
 }
 
@@ -266,10 +309,53 @@ pub struct SubfieldPatternQuery {
     pub subfield_code: char,
     /// Regex pattern for subfield value
     pattern: Regex,
+    /// Plain-string equivalent of `pattern`, when it has one
+    literal: Option<LiteralPattern>,
     /// If true, match fields where the subfield does NOT match the pattern
     pub negate: bool,
 }
 
+/// A start-anchored pattern with no regex syntax after the anchor.
+#[derive(Debug, Clone)]
+enum LiteralPattern {
+    /// `^text`: the value starts with `text`.
+    Prefix(String),
+    /// `^text$`: the value is exactly `text`.
+    Exact(String),
+}
+
+impl LiteralPattern {
+    /// Characters with a meaning in regex syntax outside a character class.
+    /// Flags and verbose mode both need `(`, so none of them can be active.
+    const META: &'static [char] = &[
+        '\\', '.', '+', '*', '?', '(', ')', '|', '[', ']', '{', '}', '^', '$',
+    ];
+
+    /// Recognize `^text` and `^text$` patterns whose `text` is literal.
+    fn parse(pattern: &str) -> Option<Self> {
+        let rest = pattern.strip_prefix('^')?;
+        let (text, exact) = match rest.strip_suffix('$') {
+            Some(text) => (text, true),
+            None => (rest, false),
+        };
+        if text.contains(Self::META) {
+            return None;
+        }
+        Some(if exact {
+            LiteralPattern::Exact(text.to_owned())
+        } else {
+            LiteralPattern::Prefix(text.to_owned())
+        })
+    }
+
+    fn is_match(&self, value: &str) -> bool {
+        match self {
+            LiteralPattern::Prefix(prefix) => value.starts_with(prefix.as_str()),
+            LiteralPattern::Exact(text) => value == text,
+        }
+    }
+}
+
 impl SubfieldPatternQuery {
     /// Create a new subfield pattern query.
     ///
@@ -300,7 +386,8 @@ impl SubfieldPatternQuery {
         Ok(SubfieldPatternQuery {
             tag: tag.into(),
             subfield_code,
-            pattern: Regex::new(pattern)?,
+            pattern: compile_pattern(pattern)?,
+            literal: LiteralPattern::parse(pattern),
             negate: false,
         })
     }
@@ -320,7 +407,8 @@ impl SubfieldPatternQuery {
         Ok(SubfieldPatternQuery {
             tag: tag.into(),
             subfield_code,
-            pattern: Regex::new(pattern)?,
+            pattern: compile_pattern(pattern)?,
+            literal: LiteralPattern::parse(pattern),
             negate: true,
         })
     }
@@ -341,9 +429,15 @@ impl SubfieldPatternQuery {
             return false;
         }
 
-        field
-            .get_subfield(self.subfield_code)
-            .is_some_and(|value| self.pattern.is_match(value) != self.negate)
+        field.get_subfield(self.subfield_code).is_some_and(|value| {
+            // Literal anchored patterns (`^978-`) are a plain string compare;
+            // anything else goes through the compiled regex.
+            let matched = match &self.literal {
+                Some(literal) => literal.is_match(value),
+                None => self.pattern.is_match(value),
+            };
+            matched != self.negate
+        })
     }
 }
 
@@ -425,10 +519,13 @@ impl SubfieldValueQuery {
     /// Check if a field matches this value query.
     #[must_use]
     pub fn matches(&self, field: &Field) -> bool {
-        if field.tag != self.tag {
-            return false;
-        }
+        field.tag == self.tag && self.matches_subfield(field)
+    }
 
+    /// Check the subfield value, ignoring the tag.
+    ///
+    /// Used on fields already taken from the query tag's bucket.
+    pub(crate) fn matches_subfield(&self, field: &Field) -> bool {
         field.get_subfield(self.subfield_code).is_some_and(|value| {
             let matched = if self.partial {
                 value.contains(self.value.as_str())
@@ -511,6 +608,26 @@ mod tests {
         assert!(!query.matches(&field));
     }
 
+    #[test]
+    fn test_query_matches_required_subfields_in_any_order() {
+        let field = create_test_field(
+            "650",
+            ' ',
+            '0',
+            &[('a', "Subject"), ('x', "History"), ('v', "Periodicals")],
+        );
+
+        let query = FieldQuery::new().has_subfields(&['v', 'a', 'x']);
+        assert!(query.matches(&field));
+
+        let query = FieldQuery::new().has_subfields(&['a', 'x', 'z']);
+        assert!(!query.matches(&field));
+
+        // Non-ASCII codes take the per-code path and still combine with ASCII ones.
+        let query = FieldQuery::new().has_subfields(&['a', 'é']);
+        assert!(!query.matches(&field));
+    }
+
     #[test]
     fn test_query_combines_criteria() {
         let field = create_test_field("650", ' ', '0', &[('a', "Subject"), ('x', "History")]);
@@ -593,6 +710,62 @@ mod tests {
         assert_eq!(negated.pattern(), r"^978-.*");
     }
 
+    #[test]
+    fn test_subfield_pattern_query_literal_patterns() {
+        let field = create_test_field("020", ' ', ' ', &[('a', "978-0-12345-678-9")]);
+
+        let prefix = SubfieldPatternQuery::new("020", 'a', "^978-").unwrap();
+        assert!(matches!(prefix.literal, Some(LiteralPattern::Prefix(_))));
+        assert!(prefix.matches(&field));
+        assert!(
+            !SubfieldPatternQuery::new("020", 'a', "^979-")
+                .unwrap()
+                .matches(&field)
+        );
+
+        let exact = SubfieldPatternQuery::new("020", 'a', "^978-0-12345-678-9$").unwrap();
+        assert!(matches!(exact.literal, Some(LiteralPattern::Exact(_))));
+        assert!(exact.matches(&field));
+        assert!(
+            !SubfieldPatternQuery::new("020", 'a', "^978-$")
+                .unwrap()
+                .matches(&field)
+        );
+
+        let negated = SubfieldPatternQuery::negated("020", 'a', "^978-").unwrap();
+        assert!(!negated.matches(&field));
+
+        // Anything with regex syntax, or no anchor, keeps using the regex.
+        for pattern in [r"^97[89]-", r"^\d{3}-", "978-", "(?i)^978-", r"^978\-"] {
+            let query = SubfieldPatternQuery::new("020", 'a', pattern).unwrap();
+            assert!(query.literal.is_none(), "{pattern}");
+            assert!(query.matches(&field), "{pattern}");
+        }
+    }
+
+    #[test]
+    fn test_subfield_pattern_query_reuses_compiled_pattern() {
+        let field = create_test_field("020", ' ', ' ', &[('a', "978-0-12345-678-9")]);
+        let first = SubfieldPatternQuery::new("020", 'a', r"^978-\d").unwrap();
+        let second = SubfieldPatternQuery::negated("020", 'a', r"^978-\d").unwrap();
+        assert!(
+            PATTERN_CACHE
+                .lock()
+                .unwrap_or_else(PoisonError::into_inner)
+                .contains_key(r"^978-\d")
+        );
+        assert!(first.matches(&field));
+        assert!(!second.matches(&field));
+
+        assert!(SubfieldPatternQuery::new("020", 'a', r"[unclosed").is_err());
+        assert!(
+            !PATTERN_CACHE
+                .lock()
+                .unwrap_or_else(PoisonError::into_inner)
+                .contains_key(r"[unclosed")
+        );
+    }
+
     #[test]
     fn test_subfield_pattern_query_different_tag() {
         let field = create_test_field("020", ' ', ' ', &[('a', "978-0-12345-678-9")]);
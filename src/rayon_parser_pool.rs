@@ -145,8 +145,8 @@ pub fn parse_batch_parallel_limited(
     buffer: &[u8],
     limit: usize,
 ) -> Result<Vec<Record>> {
-    let limited: Vec<_> = record_boundaries.iter().take(limit).copied().collect();
-    parse_batch_parallel(&limited, buffer)
+    let limited = &record_boundaries[..limit.min(record_boundaries.len())];
+    parse_batch_parallel(limited, buffer)
 }
 
 #[cfg(test)]
@@ -320,5 +320,10 @@ mod tests {
         );
         assert_eq!(records[0].get_control_field("001"), Some("rec0000"));
         assert_eq!(records[1].get_control_field("001"), Some("rec0001"));
+
+        // A limit past the end parses every boundary
+        let all =
+            parse_batch_parallel_limited(&boundaries, &buffer, 10).expect("parse should succeed");
+        assert_eq!(all.len(), originals.len());
     }
 }
@@ -302,17 +302,7 @@ impl Record {
         indicator2: Option<char>,
     ) -> impl Iterator<Item = &Field> + use<'_> {
         self.fields_by_tag(tag).filter(move |field| {
-            if let Some(ind1) = indicator1
-                && field.indicator1 != ind1
-            {
-                return false;
-            }
-            if let Some(ind2) = indicator2
-                && field.indicator2 != ind2
-            {
-                return false;
-            }
-            true
+            crate::field_query::indicators_match(field, indicator1, indicator2)
         })
     }
 
@@ -336,11 +326,14 @@ impl Record {
         start_tag: &str,
         end_tag: &str,
     ) -> impl Iterator<Item = &Field> + use<'_> {
-        let start = start_tag.to_string();
-        let end = end_tag.to_string();
+        // The iterator owns copies of the bounds, so it does not borrow the
+        // caller's strings. Tags are three bytes, so the copies stay inline
+        // and no per-call allocation is made. Byte order matches `str` order.
+        let start = SmallVec::<[u8; 4]>::from_slice(start_tag.as_bytes());
+        let end = SmallVec::<[u8; 4]>::from_slice(end_tag.as_bytes());
         self.fields
             .iter()
-            .filter(move |(tag, _)| *tag >= &start && *tag <= &end)
+            .filter(move |(tag, _)| (&start[..]..=&end[..]).contains(&tag.as_bytes()))
             .flat_map(|(_, fields)| fields.iter())
     }
 
@@ -384,6 +377,9 @@ impl Record {
 
     /// Iterate over fields matching a query.
     ///
+    /// When the query names a tag, only that tag's fields are visited (a
+    /// single map lookup); otherwise every field is tested.
+    ///
     /// # Examples
     ///
     /// ```ignore
@@ -402,7 +398,15 @@ impl Record {
         &'a self,
         query: &'a crate::field_query::FieldQuery,
     ) -> impl Iterator<Item = &'a Field> + 'a {
-        self.fields().filter(move |field| query.matches(field))
+        let (tagged, untagged) = match query.tag.as_deref() {
+            Some(tag) => (Some(self.fields_by_tag(tag)), None),
+            None => (None, Some(self.fields())),
+        };
+        tagged
+            .into_iter()
+            .flatten()
+            .chain(untagged.into_iter().flatten())
+            .filter(move |field| query.matches(field))
     }
 
     /// Iterate over fields matching a tag range query.
@@ -429,7 +433,7 @@ impl Record {
         query: &'a crate::field_query::TagRangeQuery,
     ) -> impl Iterator<Item = &'a Field> + 'a {
         self.fields_in_range(&query.start_tag, &query.end_tag)
-            .filter(move |field| query.matches(field))
+            .filter(move |field| query.matches_criteria(field))
     }
 
     /// Find all fields where a subfield value matches a regex pattern.
@@ -485,7 +489,7 @@ impl Record {
         query: &'a crate::field_query::SubfieldValueQuery,
     ) -> impl Iterator<Item = &'a Field> + 'a {
         self.fields_by_tag(&query.tag)
-            .filter(move |field| query.matches(field))
+            .filter(move |field| query.matches_subfield(field))
     }
 
     // ============================================================================
@@ -920,7 +924,7 @@ impl crate::field_query_helpers::FieldQueryHelpers for Record {
 
     fn fields_matching_value(&self, query: &crate::field_query::SubfieldValueQuery) -> Vec<&Field> {
         self.fields_by_tag(&query.tag)
-            .filter(|field| query.matches(field))
+            .filter(|field| query.matches_subfield(field))
             .collect()
     }
 
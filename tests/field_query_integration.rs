@@ -60,6 +60,16 @@ fn test_fields_in_range_subjects() {
     }
 }
 
+#[test]
+fn test_fields_in_range_outlives_temporary_bounds() {
+    let record = create_realistic_record();
+
+    // The iterator must not borrow the bound strings, so it can be kept
+    // past a temporary bound.
+    let subjects = record.fields_in_range(&format!("6{:02}", 0), "699");
+    assert_eq!(subjects.count(), 4);
+}
+
 #[test]
 fn test_fields_in_range_names() {
     let record = create_realistic_record();
@@ -155,6 +165,21 @@ fn test_field_query_multiple_subfields() {
     assert_eq!(matching.len(), 2);
 }
 
+#[test]
+fn test_field_query_tag_matches_tag_filter() {
+    let record = create_realistic_record();
+
+    // A tagged query returns the same fields, in order, as filtering by tag.
+    let query = FieldQuery::new().tag("650").has_subfield('a');
+    let matching: Vec<_> = record.fields_matching(&query).collect();
+    let expected: Vec<_> = record
+        .fields_by_tag("650")
+        .filter(|f| f.get_subfield('a').is_some())
+        .collect();
+
+    assert_eq!(matching, expected);
+}
+
 #[test]
 fn test_field_query_no_tag() {
     let record = create_realistic_record();
@@ -2,7 +2,13 @@
 Pytest configuration and fixtures for Python wrapper benchmarks.
 """
 
+import contextlib
+import gc
 import io
+import itertools
+import mmap
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -34,6 +40,49 @@ def fixture_10k(fixture_dir):
         return f.read()
 
 
+def _map_fixture(path):
+    """Yield a read-only memoryview over an mmap of ``path``.
+
+    Readers snapshot the view rather than borrowing it: the mapped file
+    could be modified or truncated underneath a borrowed slice. The
+    fixture covers the mmap input path, not a zero-copy one.
+    """
+    if not path.exists():
+        pytest.skip(f"Fixture not found: {path}")
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    yield view
+    gc.collect()
+    # Anything still holding the buffer blocks the release; the mapping is
+    # then left for interpreter exit to unmap.
+    with contextlib.suppress(BufferError):
+        view.release()
+        mapped.close()
+
+
+@pytest.fixture(scope="session")
+def simple_book_bytes():
+    """Load tests/data/simple_book.mrc (a single record) as bytes."""
+    return (
+        Path(__file__).parent.parent / "data" / "simple_book.mrc"
+    ).read_bytes()
+
+
+@pytest.fixture(scope="session")
+def multi_records_bytes():
+    """Load tests/data/multi_records.mrc (several records) as bytes."""
+    return (
+        Path(__file__).parent.parent / "data" / "multi_records.mrc"
+    ).read_bytes()
+
+
+@pytest.fixture(scope="session")
+def fixture_1k_view(fixture_dir):
+    """Read-only, mmap-backed memoryview of the 1k record fixture."""
+    yield from _map_fixture(fixture_dir / "1k_records.mrc")
+
+
 @pytest.fixture(scope="session")
 def fixture_1k_path(fixture_dir):
     """Path to the 1k record fixture file on disk."""
@@ -59,11 +108,7 @@ def fixture_small(fixture_1k):
     from mrrc import MARCReader
 
     reader = MARCReader(io.BytesIO(fixture_1k))
-    small_records = []
-    for i, record in enumerate(reader):
-        small_records.append(record)
-        if i >= 9:  # 10 records
-            break
+    small_records = list(itertools.islice(reader, 10))
 
     # Serialize back to bytes
     from mrrc import MARCWriter
@@ -82,11 +127,7 @@ def fixture_217(fixture_1k):
     from mrrc import MARCReader, MARCWriter
 
     reader = MARCReader(io.BytesIO(fixture_1k))
-    records = []
-    for i, record in enumerate(reader):
-        records.append(record)
-        if i >= 216:  # 217 records (0-216 inclusive)
-            break
+    records = list(itertools.islice(reader, 217))
 
     output = io.BytesIO()
     writer = MARCWriter(output)
@@ -102,11 +143,7 @@ def fixture_500(fixture_1k):
     from mrrc import MARCReader, MARCWriter
 
     reader = MARCReader(io.BytesIO(fixture_1k))
-    records = []
-    for i, record in enumerate(reader):
-        records.append(record)
-        if i >= 499:  # 500 records
-            break
+    records = list(itertools.islice(reader, 500))
 
     output = io.BytesIO()
     writer = MARCWriter(output)
@@ -117,26 +154,46 @@ def fixture_500(fixture_1k):
 
 
 @pytest.fixture(scope="session")
-def fixture_5k(fixture_1k, fixture_10k):
+def fixture_5k(records_10k):
     """Create a fixture with 5k records (halfway between 1k and 10k)."""
-    # Use first 5 copies of 1k fixture
-    from mrrc import MARCReader, MARCWriter
-
-    reader = MARCReader(io.BytesIO(fixture_10k))
-    records = []
-    for i, record in enumerate(reader):
-        records.append(record)
-        if i >= 4999:  # 5000 records
-            break
+    from mrrc import MARCWriter
 
     output = io.BytesIO()
     writer = MARCWriter(output)
-    for record in records:
-        writer.write_record(record)
+    writer.write_records(records_10k[:5000])
     writer.close()
     return output.getvalue()
 
 
+# Parsed record lists, shared across the session so tests that only read
+# records don't each re-parse the fixture. Treat them as read-only: tests
+# that mutate records must parse their own copy.
+
+
+@pytest.fixture(scope="session")
+def records_1k(fixture_1k):
+    """Parsed records from the 1k fixture."""
+    from mrrc import MARCReader
+
+    return list(MARCReader(io.BytesIO(fixture_1k)))
+
+
+@pytest.fixture(scope="session")
+def records_5k(fixture_5k):
+    """Parsed records from the 5k fixture."""
+    from mrrc import MARCReader
+
+    return list(MARCReader(io.BytesIO(fixture_5k)))
+
+
+@pytest.fixture(scope="session")
+def records_10k(fixture_10k):
+    """Parsed records from the 10k fixture."""
+    from mrrc import MARCReader
+
+    return list(MARCReader(io.BytesIO(fixture_10k)))
+
+
 @pytest.fixture(scope="session")
 def fixture_with_error(fixture_small):
     """Create a fixture that contains a malformed record for error testing."""
@@ -144,6 +201,32 @@ def fixture_with_error(fixture_small):
     return fixture_small + b"00"  # Incomplete record length field
 
 
+def _primed_pool(workers):
+    """Thread pool whose worker threads are already running.
+
+    The pool spawns a thread per submit until one goes idle, so briefly
+    sleeping tasks force all ``workers`` threads to start before any timed
+    block, keeping thread creation out of the measurements.
+    """
+    pool = ThreadPoolExecutor(max_workers=workers)
+    list(pool.map(time.sleep, [0.01] * workers))
+    return pool
+
+
+@pytest.fixture(scope="module")
+def executor_2():
+    """Module-shared, pre-started 2-thread pool."""
+    with _primed_pool(2) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="module")
+def executor_4():
+    """Module-shared, pre-started 4-thread pool."""
+    with _primed_pool(4) as pool:
+        yield pool
+
+
 @pytest.fixture
 def fixture_1k_io(fixture_1k):
     """Return 1k fixture as file-like object."""
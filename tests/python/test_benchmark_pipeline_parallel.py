@@ -14,8 +14,6 @@ performance. It uses:
 Expected performance: 2.0x speedup (2 threads), 3.74x (4 threads)
 """
 
-from concurrent.futures import ThreadPoolExecutor
-
 import pytest
 
 from mrrc import ProducerConsumerPipeline
@@ -56,7 +54,7 @@ class TestProducerConsumerPipelineBasic:
         assert result == 40000
 
     @pytest.mark.benchmark
-    def test_pipeline_parallel_2x_10k_threaded(self, benchmark):
+    def test_pipeline_parallel_2x_10k_threaded(self, benchmark, executor_2):
         """Parallel: 2 threads, each with own ProducerConsumerPipeline.
 
         This is the CORRECT way to test multi-threaded performance:
@@ -73,15 +71,14 @@ class TestProducerConsumerPipelineBasic:
                     count += 1
                 return count
 
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                results = list(executor.map(read_pipeline, range(2)))
+            results = list(executor_2.map(read_pipeline, range(2)))
             return sum(results)
 
         result = benchmark(read_parallel)
         assert result == 20000
 
     @pytest.mark.benchmark
-    def test_pipeline_parallel_4x_10k_threaded(self, benchmark):
+    def test_pipeline_parallel_4x_10k_threaded(self, benchmark, executor_4):
         """Parallel: 4 threads, each with own ProducerConsumerPipeline.
 
         This is the test that demonstrates parallel speedup with the pipeline.
@@ -99,8 +96,7 @@ class TestProducerConsumerPipelineBasic:
                     count += 1
                 return count
 
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                results = list(executor.map(read_pipeline, range(4)))
+            results = list(executor_4.map(read_pipeline, range(4)))
             return sum(results)
 
         result = benchmark(read_parallel)
@@ -129,7 +125,9 @@ class TestProducerConsumerPipelineWithExtraction:
         assert result == 40000
 
     @pytest.mark.benchmark
-    def test_pipeline_parallel_extraction_4x_10k_threaded(self, benchmark):
+    def test_pipeline_parallel_extraction_4x_10k_threaded(
+        self, benchmark, executor_4
+    ):
         """Parallel: 4 threads with field extraction (realistic workload).
 
         Pipeline + extraction with multi-threading:
@@ -148,8 +146,7 @@ class TestProducerConsumerPipelineWithExtraction:
                     count += 1
                 return count
 
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                results = list(executor.map(process_pipeline, range(4)))
+            results = list(executor_4.map(process_pipeline, range(4)))
             return sum(results)
 
         result = benchmark(read_with_extraction)
@@ -176,7 +173,7 @@ class TestProducerConsumerPipelineMultiFile:
         assert result == 40000
 
     @pytest.mark.benchmark
-    def test_process_4_files_parallel_4_threads(self, benchmark):
+    def test_process_4_files_parallel_4_threads(self, benchmark, executor_4):
         """Process 4 files in parallel with 4 threads (optimal threading).
 
         This demonstrates the parallel pipeline infrastructure:
@@ -195,15 +192,14 @@ class TestProducerConsumerPipelineMultiFile:
                     count += 1
                 return count
 
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                results = list(executor.map(process_file, range(4)))
+            results = list(executor_4.map(process_file, range(4)))
             return sum(results)
 
         result = benchmark(process_parallel)
         assert result == 40000
 
     @pytest.mark.benchmark
-    def test_process_8_files_parallel_4_threads(self, benchmark):
+    def test_process_8_files_parallel_4_threads(self, benchmark, executor_4):
         """Process 8 files with 4 threads (oversubscription test).
 
         Tests thread pool efficiency with more files than threads.
@@ -219,8 +215,7 @@ class TestProducerConsumerPipelineMultiFile:
                     count += 1
                 return count
 
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                results = list(executor.map(process_file, range(8)))
+            results = list(executor_4.map(process_file, range(8)))
             return sum(results)
 
         result = benchmark(process_parallel)
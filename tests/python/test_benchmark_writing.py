@@ -4,9 +4,6 @@ Benchmark tests for MARC record writing performance.
 
 import io
 import os
-import tempfile
-import time
-from pathlib import Path
 
 import pytest
 
@@ -113,7 +110,7 @@ class TestRustFileBackendBenchmarks:
     """Benchmarks for RustFile backend (direct file I/O via Rust)."""
 
     @pytest.mark.benchmark
-    def test_write_only_1k_rustfile(self, benchmark, fixture_1k):
+    def test_write_only_1k_rustfile(self, benchmark, fixture_1k, tmp_path):
         """Benchmark writing 1,000 records via RustFile backend (file path)."""
         # Pre-load records outside of benchmark
         data = io.BytesIO(fixture_1k)
@@ -122,31 +119,24 @@ class TestRustFileBackendBenchmarks:
         while record := reader.read_record():
             records.append(record)
 
+        # The writer truncates on open, so every round reuses one path
+        temp_path = str(tmp_path / "out.mrc")
+
         def write_all():
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=".mrc"
-            ) as tmp:
-                temp_path = tmp.name
-
-            try:
-                # Write using RustFile backend (string path)
-                writer = MARCWriter(temp_path)
-                for record in records:
-                    writer.write_record(record)
-                writer.close()
-
-                # Read the file size
-                file_size = os.path.getsize(temp_path)
-                return file_size
-            finally:
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+            # Write using RustFile backend (string path)
+            writer = MARCWriter(temp_path)
+            for record in records:
+                writer.write_record(record)
+            writer.close()
+
+            # Read the file size
+            return os.path.getsize(temp_path)
 
         result = benchmark(write_all)
         assert result > 0
 
     @pytest.mark.benchmark
-    def test_write_only_10k_rustfile(self, benchmark, fixture_10k):
+    def test_write_only_10k_rustfile(self, benchmark, fixture_10k, tmp_path):
         """Benchmark writing 10,000 records via RustFile backend."""
         # Pre-load records
         data = io.BytesIO(fixture_10k)
@@ -155,31 +145,24 @@ class TestRustFileBackendBenchmarks:
         while record := reader.read_record():
             records.append(record)
 
+        # The writer truncates on open, so every round reuses one path
+        temp_path = str(tmp_path / "out.mrc")
+
         def write_all():
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=".mrc"
-            ) as tmp:
-                temp_path = tmp.name
-
-            try:
-                # Write using RustFile backend
-                writer = MARCWriter(temp_path)
-                for record in records:
-                    writer.write_record(record)
-                writer.close()
-
-                # Read the file size
-                file_size = os.path.getsize(temp_path)
-                return file_size
-            finally:
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+            # Write using RustFile backend
+            writer = MARCWriter(temp_path)
+            for record in records:
+                writer.write_record(record)
+            writer.close()
+
+            # Read the file size
+            return os.path.getsize(temp_path)
 
         result = benchmark(write_all)
         assert result > 0
 
     @pytest.mark.benchmark
-    def test_write_pathlib_1k_rustfile(self, benchmark, fixture_1k):
+    def test_write_pathlib_1k_rustfile(self, benchmark, fixture_1k, tmp_path):
         """Benchmark writing 1,000 records via RustFile backend with pathlib.Path."""
         # Pre-load records
         data = io.BytesIO(fixture_1k)
@@ -188,89 +171,58 @@ class TestRustFileBackendBenchmarks:
         while record := reader.read_record():
             records.append(record)
 
+        temp_path = tmp_path / "out.mrc"
+
         def write_all():
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=".mrc"
-            ) as tmp:
-                temp_path = Path(tmp.name)
-
-            try:
-                # Write using RustFile backend with Path object
-                writer = MARCWriter(temp_path)
-                for record in records:
-                    writer.write_record(record)
-                writer.close()
-
-                # Get file size
-                file_size = temp_path.stat().st_size
-                return file_size
-            finally:
-                if temp_path.exists():
-                    temp_path.unlink()
+            # Write using RustFile backend with Path object
+            writer = MARCWriter(temp_path)
+            for record in records:
+                writer.write_record(record)
+            writer.close()
+
+            # Get file size
+            return temp_path.stat().st_size
 
         result = benchmark(write_all)
         assert result > 0
 
 
 class TestBackendComparison:
-    """Performance comparison between PythonFile (BytesIO) and RustFile backends."""
+    """PythonFile (BytesIO) vs RustFile write performance for 1k records.
 
-    @pytest.mark.benchmark
-    def test_backend_comparison_1k(self, fixture_1k):
-        """Compare PythonFile vs RustFile performance for 1k records."""
-        # Pre-load records
-        data = io.BytesIO(fixture_1k)
-        reader = MARCReader(data)
-        records = []
-        while record := reader.read_record():
-            records.append(record)
+    The two tests share a benchmark group so pytest-benchmark reports them
+    side by side, with its own warm-up, round statistics and outlier
+    handling.
+    """
 
-        # Benchmark PythonFile backend (BytesIO)
-        # Use 5 iterations and median to drop outliers from CI runner noise
-        pythonfile_times = []
-        for _ in range(5):
-            start = time.perf_counter()
+    @pytest.mark.benchmark(group="write-backend-1k")
+    def test_backend_comparison_1k_pythonfile(self, benchmark, records_1k):
+        """Write 1,000 records to a BytesIO (PythonFile backend)."""
+
+        def write_bytesio():
             output = io.BytesIO()
             writer = MARCWriter(output)
-            for record in records:
+            for record in records_1k:
                 writer.write_record(record)
             writer.close()
-            elapsed = time.perf_counter() - start
-            pythonfile_times.append(elapsed)
-
-        # Benchmark RustFile backend (file path)
-        rustfile_times = []
-        for _ in range(5):
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=".mrc"
-            ) as tmp:
-                temp_path = tmp.name
-
-            try:
-                start = time.perf_counter()
-                writer = MARCWriter(temp_path)
-                for record in records:
-                    writer.write_record(record)
-                writer.close()
-                elapsed = time.perf_counter() - start
-                rustfile_times.append(elapsed)
-            finally:
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-
-        # Use median to naturally drop outlier spikes from CI runner noise
-        median_pythonfile = sorted(pythonfile_times)[
-            len(pythonfile_times) // 2
-        ]
-        median_rustfile = sorted(rustfile_times)[len(rustfile_times) // 2]
-
-        # RustFile should be comparable to PythonFile (no regression)
-        # Note: exact performance depends on system I/O, so we just verify no major regression
-        speedup = median_pythonfile / median_rustfile
-        print("\n1k records benchmark:")
-        print(f"  PythonFile (BytesIO): {median_pythonfile * 1000:.2f}ms")
-        print(f"  RustFile (temp file): {median_rustfile * 1000:.2f}ms")
-        print(f"  Speedup ratio: {speedup:.2f}x")
-
-        # No assertion — timing comparisons on shared CI runners are too noisy
-        # for reliable pass/fail. The printed output above is informational.
+            return len(output.getvalue())
+
+        result = benchmark.pedantic(write_bytesio, rounds=10, warmup_rounds=3)
+        assert result > 0
+
+    @pytest.mark.benchmark(group="write-backend-1k")
+    def test_backend_comparison_1k_rustfile(
+        self, benchmark, records_1k, tmp_path
+    ):
+        """Write 1,000 records to a file path (RustFile backend)."""
+        temp_path = str(tmp_path / "out.mrc")
+
+        def write_file():
+            writer = MARCWriter(temp_path)
+            for record in records_1k:
+                writer.write_record(record)
+            writer.close()
+            return os.path.getsize(temp_path)
+
+        result = benchmark.pedantic(write_file, rounds=10, warmup_rounds=3)
+        assert result > 0
@@ -51,6 +51,13 @@ def test_getitem_indicator_assignment_persists() -> None:
     assert record["245"].indicator1 == "0"
 
 
+def test_getitem_indicators_assignment_persists() -> None:
+    """``record[tag].indicators = (...)`` writes both through to the record."""
+    record = _build_record()
+    record["245"].indicators = ("0", "4")
+    assert (record["245"].indicator1, record["245"].indicator2) == ("0", "4")
+
+
 def test_getitem_add_subfield_persists() -> None:
     """``record[tag].add_subfield(...)`` writes through to the record."""
     record = _build_record()
@@ -15,10 +15,11 @@ import io
 import sys
 import threading
 import time
+from pathlib import Path
 
 import pytest
 
-from mrrc import MARCReader
+from mrrc import MARCReader, RecordBoundaryScanner, parse_batch_parallel
 
 
 @pytest.fixture
@@ -66,8 +67,11 @@ def _run_with_counter_thread(iterate_fn):
 class TestGILReleaseVerification:
     """Verify that py.detach() actually releases the GIL during record parsing."""
 
-    def test_rustfile_releases_gil(self, suppress_auto_switching, mrc_file):
-        reader = MARCReader(str(mrc_file))
+    @pytest.mark.parametrize("as_path", [str, Path], ids=["str", "pathlib"])
+    def test_rustfile_releases_gil(
+        self, suppress_auto_switching, mrc_file, as_path
+    ):
+        reader = MARCReader(as_path(mrc_file))
         assert reader.backend_type == "rust_file"
 
         def iterate():
@@ -109,3 +113,25 @@ class TestGILReleaseVerification:
         counter, record_count = _run_with_counter_thread(iterate)
         assert record_count == 1000
         assert counter > 0, "Counter thread never ran — GIL was not released"
+
+    @pytest.mark.parametrize(
+        "as_buffer",
+        [
+            bytes,
+            bytearray,
+            lambda data: memoryview(bytearray(data)).toreadonly(),
+        ],
+        ids=["borrowed", "copied", "readonly-view-copied"],
+    )
+    def test_parse_batch_parallel_releases_gil(
+        self, suppress_auto_switching, fixture_1k, as_buffer
+    ):
+        buffer = as_buffer(fixture_1k)
+        boundaries = RecordBoundaryScanner().scan(fixture_1k)
+
+        def parse():
+            return len(parse_batch_parallel(boundaries, buffer))
+
+        counter, record_count = _run_with_counter_thread(parse)
+        assert record_count == 1000
+        assert counter > 0, "Counter thread never ran — GIL was not released"
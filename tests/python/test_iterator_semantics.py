@@ -293,6 +293,38 @@ class TestResumeAfterPartialRead:
 
         assert len(records) == 1000
 
+    def test_count_records_counts_remainder(self, fixture_1k):
+        """count_records() counts only what iteration has not consumed"""
+        reader = MARCReader(io.BytesIO(fixture_1k))
+
+        # Stop mid-batch so the count starts from a partly drained queue
+        for _ in range(75):
+            next(reader)
+
+        assert reader.count_records() == 925
+
+        # The reader is consumed afterwards
+        with pytest.raises(StopIteration):
+            next(reader)
+        assert reader.count_records() == 0
+
+    def test_drain_returns_remainder(self, fixture_1k):
+        """drain() returns what iteration has not consumed, in order"""
+        expected = [r.to_marc21() for r in MARCReader(fixture_1k)]
+        reader = MARCReader(io.BytesIO(fixture_1k))
+
+        # Stop mid-batch so the drain starts from a partly drained queue
+        for _ in range(75):
+            next(reader)
+
+        drained = reader.drain()
+        assert [r.to_marc21() for r in drained] == expected[75:]
+
+        # The reader is consumed afterwards
+        with pytest.raises(StopIteration):
+            next(reader)
+        assert reader.drain() == []
+
     def test_records_outlive_partially_consumed_reader(self, fixture_10k):
         """Destroying a partially-consumed reader must not invalidate
         records already handed out: they are independent objects, not
@@ -154,6 +154,34 @@ class TestPermissive:
         assert len(records) == 2
         assert all(r is not None for r in records)
 
+    def test_count_records_permissive_skips_bad_record(self):
+        """count_records() skips failed parses under permissive=True and
+        raises under permissive=False."""
+        data = _build_two_record_stream(inject_bad_second=True)
+        reader = mrrc.MARCReader(io.BytesIO(data), permissive=True)
+        assert reader.count_records() == 1
+
+        reader = mrrc.MARCReader(
+            io.BytesIO(data), permissive=False, recovery_mode="strict"
+        )
+        with pytest.raises(mrrc.exceptions.MrrcException):
+            reader.count_records()
+
+    def test_drain_permissive_skips_bad_record(self):
+        """drain() skips failed parses under permissive=True and raises
+        under permissive=False."""
+        data = _build_two_record_stream(inject_bad_second=True)
+        reader = mrrc.MARCReader(io.BytesIO(data), permissive=True)
+        records = reader.drain()
+        assert len(records) == 1
+        assert records[0] is not None
+
+        reader = mrrc.MARCReader(
+            io.BytesIO(data), permissive=False, recovery_mode="strict"
+        )
+        with pytest.raises(mrrc.exceptions.MrrcException):
+            reader.drain()
+
     def test_permissive_pymarc_pattern(self):
         """The standard pymarc permissive pattern should work."""
         data = _build_two_record_stream(inject_bad_second=True)
@@ -16,7 +16,7 @@ from pathlib import Path
 
 import pytest
 
-from mrrc import MARCReader
+from mrrc import AuthorityMARCReader, HoldingsMARCReader, MARCReader
 
 
 class TestBackendTypeRouting:
@@ -41,6 +41,22 @@ class TestBackendTypeRouting:
         reader = MARCReader(fixture_1k)
         assert reader.backend_type == "cursor"
 
+    def test_readonly_memoryview_uses_cursor(self, fixture_1k_view):
+        reader = MARCReader(fixture_1k_view)
+        assert reader.backend_type == "cursor"
+        assert sum(1 for _ in reader) == 1000
+
+    def test_memoryview_over_bytes_uses_cursor(self, fixture_1k):
+        reader = MARCReader(memoryview(fixture_1k))
+        assert reader.backend_type == "cursor"
+        assert sum(1 for _ in reader) == 1000
+
+    def test_readonly_view_over_bytearray_is_snapshotted(self, fixture_1k):
+        data = bytearray(fixture_1k)
+        reader = MARCReader(memoryview(data).toreadonly())
+        data[:5] = b"00000"  # corrupt the first record length afterwards
+        assert sum(1 for _ in reader) == 1000
+
     def test_file_object_uses_python_file(self, mrc_file):
         with open(mrc_file, "rb") as f:
             reader = MARCReader(f)
@@ -50,6 +66,16 @@ class TestBackendTypeRouting:
         reader = MARCReader(io.BytesIO(fixture_1k))
         assert reader.backend_type == "python_file"
 
+    @pytest.mark.parametrize(
+        "reader_cls", [AuthorityMARCReader, HoldingsMARCReader]
+    )
+    def test_typed_readers_report_backend(self, reader_cls, mrc_file):
+        assert reader_cls(mrc_file).backend_type == "rust_file"
+        assert reader_cls(str(mrc_file)).backend_type == "rust_file"
+        assert reader_cls(mrc_file.read_bytes()).backend_type == "cursor"
+        with open(mrc_file, "rb") as f:
+            assert reader_cls(f).backend_type == "python_file"
+
     def test_pathlib_and_str_same_backend(self, mrc_file):
         """The actual invariant: pathlib.Path and str produce the same backend."""
         str_reader = MARCReader(str(mrc_file))
@@ -89,10 +115,7 @@ class TestPathlibThreadingCorrectness:
         """Parallel reading with pathlib.Path completes without error."""
 
         def read_file(path):
-            count = 0
-            for _ in MARCReader(path):
-                count += 1
-            return count
+            return MARCReader(path).count_records()
 
         with ThreadPoolExecutor(max_workers=4) as executor:
             results = list(executor.map(read_file, temp_pathlib_fixtures))
@@ -23,10 +23,15 @@ from mrrc import Field, Leader, MARCReader, Record
 
 def create_field(tag, ind1=" ", ind2=" ", **subfields):
     """PYMARC COMPAT: Helper to create a field with subfields."""
-    field = Field(tag, ind1, ind2)
-    for code, value in subfields.items():
-        field.add_subfield(code, value)
-    return field
+    return Field(tag, ind1, ind2, subfields=list(subfields.items()))
+
+
+@pytest.fixture(scope="module")
+def serialized_record():
+    """JSON and XML output of one 245 record, serialized once per module."""
+    record = Record()
+    record.add_field(create_field("245", "1", "0", a="Title"))
+    return record.to_json(), record.to_xml()
 
 
 # ============================================================================
@@ -169,36 +174,77 @@ class TestRecordFieldNotFound:
         assert len(record.fields()) == 0
 
 
-class TestRecordAuthor:
-    """PYMARC COMPAT: test_author"""
-
-    def test_author_from_100_field(self):
-        """Test getting author from 100 field."""
-        record = Record()
-        assert record.author is None
-
-        record.add_field(
-            create_field("100", "1", " ", a="Bletch, Foobie,", d="1979-1981.")
-        )
-        assert record.author is not None
-        assert "Bletch" in record.author
-
-
-class TestRecordUniformTitle:
-    """PYMARC COMPAT: test_uniformtitle"""
-
-    def test_uniform_title_from_130_field(self):
-        """Test getting uniform title from 130 field."""
+ACCESSOR_CASES = [
+    (
+        "100",
+        "1",
+        " ",
+        {"a": "Bletch, Foobie,", "d": "1979-1981."},
+        "author",
+        "Bletch",
+    ),
+    (
+        "130",
+        "0",
+        " ",
+        {"a": "Tosefta.", "l": "English.", "f": "1977."},
+        "uniform_title",
+        None,
+    ),
+    (
+        "260",
+        " ",
+        " ",
+        {"a": "Paris :", "b": "Gauthier-Villars ;", "c": "1955."},
+        "publisher",
+        "Villars",
+    ),
+    (
+        "260",
+        " ",
+        " ",
+        {"a": "Paris :", "b": "Gauthier-Villars ;", "c": "1955."},
+        "pubyear",
+        None,
+    ),
+    ("020", " ", " ", {"a": "0914378287"}, "isbn", None),
+    ("022", " ", " ", {"a": "0028-0836"}, "issn", "0028-0836"),
+    ("245", "1", "0", {"a": "Python Programming"}, "title", "Python"),
+    (
+        "300",
+        " ",
+        " ",
+        {
+            "a": "1 photographic print :",
+            "b": "gelatin silver ;",
+            "c": "10 x 56 in.",
+        },
+        "physical_description",
+        None,
+    ),
+]
+
+
+class TestRecordAccessors:
+    """PYMARC COMPAT: test_author, test_uniformtitle, test_publisher,
+    test_pubyear, test_isbn, test_issn, test_title, test_physicaldescription
+    """
+
+    @pytest.mark.parametrize(
+        "tag,ind1,ind2,subfields,accessor,needle", ACCESSOR_CASES
+    )
+    def test_accessor_from_field(
+        self, tag, ind1, ind2, subfields, accessor, needle
+    ):
+        """Accessor is None on an empty record and set once the field exists."""
         record = Record()
-        assert record.uniform_title is None
+        assert getattr(record, accessor) is None
 
-        record.add_field(
-            create_field(
-                "130", "0", " ", a="Tosefta.", l="English.", f="1977."
-            )
-        )
-        uniform_title = record.uniform_title
-        assert uniform_title is not None
+        record.add_field(create_field(tag, ind1, ind2, **subfields))
+        value = getattr(record, accessor)
+        assert value is not None
+        if needle:
+            assert needle in value
 
 
 class TestRecordSubjects:
@@ -213,7 +259,8 @@ class TestRecordSubjects:
 
         subjects = record.subjects
         assert len(subjects) >= 2
-        assert any("Computer" in s for s in subjects)
+        assert "Computer science" in subjects
+        assert "Python language" in subjects
 
     def test_subjects_from_all_6xx_fields(self):
         """Test that subjects() returns entries from all 6xx fields, matching pymarc."""
@@ -243,19 +290,6 @@ class TestRecordSubjects:
 class TestRecordPublisher:
     """PYMARC COMPAT: test_publisher"""
 
-    def test_publisher_from_260_field(self):
-        """Test getting publisher from 260 field."""
-        record = Record()
-        assert record.publisher is None
-
-        record.add_field(
-            create_field(
-                "260", " ", " ", a="Paris :", b="Gauthier-Villars ;", c="1955."
-            )
-        )
-        assert record.publisher is not None
-        assert "Villars" in record.publisher
-
     def test_publisher_from_264_rda_field(self):
         """Test getting publisher from 264 field (RDA cataloging)."""
         record = Record()
@@ -288,19 +322,6 @@ class TestRecordPublisher:
 class TestRecordPublicationYear:
     """PYMARC COMPAT: test_pubyear"""
 
-    def test_publication_year_from_260_field(self):
-        """Test getting publication year from 260 field."""
-        record = Record()
-        assert record.pubyear is None
-
-        record.add_field(
-            create_field(
-                "260", " ", " ", a="Paris :", b="Gauthier-Villars ;", c="1955."
-            )
-        )
-        year = record.pubyear
-        assert year is not None
-
     def test_publication_year_from_264_rda_field(self):
         """Test getting publication year from 264 field (RDA cataloging)."""
         record = Record()
@@ -308,46 +329,6 @@ class TestRecordPublicationYear:
         assert record.pubyear == "2022"
 
 
-class TestRecordISBN:
-    """PYMARC COMPAT: test_isbn"""
-
-    def test_isbn_from_020_field(self):
-        """Test getting ISBN from 020 field."""
-        record = Record()
-        assert record.isbn is None
-
-        record.add_field(create_field("020", " ", " ", a="0914378287"))
-        assert record.isbn is not None
-
-
-class TestRecordISSN:
-    """PYMARC COMPAT: test_issn"""
-
-    def test_issn_from_022_field(self):
-        """Test getting ISSN from 022 field."""
-        record = Record()
-        assert record.issn is None
-
-        record.add_field(create_field("022", " ", " ", a="0028-0836"))
-        issn = record.issn
-        assert issn is not None
-        assert "0028-0836" in issn
-
-
-class TestRecordTitle:
-    """PYMARC COMPAT: test_title"""
-
-    def test_title_from_245_field(self):
-        """Test getting title from 245 field."""
-        record = Record()
-        assert record.title is None
-
-        record.add_field(create_field("245", "1", "0", a="Python Programming"))
-        title = record.title
-        assert title is not None
-        assert "Python" in title
-
-
 class TestRecordAsMarc:
     """PYMARC COMPAT: test_as_marc"""
 
@@ -363,57 +344,29 @@ class TestRecordAsMarc:
         marc_bytes = record.to_marc21()
 
         assert isinstance(marc_bytes, bytes)
-        assert len(marc_bytes) > 0
 
-        # First 24 bytes are leader
-        assert len(marc_bytes) >= 24
+        # Leader: record length (00-04) and status (05), then the record
+        # terminator; checked on the bytes without re-parsing them.
+        assert int(marc_bytes[:5]) == len(marc_bytes)
+        assert marc_bytes[5:6] in b"acdnp"
+        assert marc_bytes.endswith(b"\x1d")
 
 
 class TestRecordAsJsonXml:
     """PYMARC COMPAT: test_as_json, test_as_xml"""
 
-    def test_as_json_format(self):
+    def test_as_json_format(self, serialized_record):
         """Test as_json() serialization."""
-        record = Record()
-        record.add_field(create_field("245", "1", "0", a="Title"))
-
-        json_str = record.to_json()
-        assert json_str is not None
+        json_str, _ = serialized_record
         assert isinstance(json_str, str)
 
-    def test_as_xml_format(self):
+    def test_as_xml_format(self, serialized_record):
         """Test as_xml() serialization."""
-        record = Record()
-        record.add_field(create_field("245", "1", "0", a="Title"))
-
-        xml_str = record.to_xml()
-        assert xml_str is not None
+        _, xml_str = serialized_record
         assert isinstance(xml_str, str)
         assert "<" in xml_str
 
 
-class TestRecordPhysicalDescription:
-    """PYMARC COMPAT: test_physicaldescription"""
-
-    def test_physical_description(self):
-        """Test physical description property."""
-        record = Record()
-        assert record.physical_description is None
-
-        record.add_field(
-            create_field(
-                "300",
-                " ",
-                " ",
-                a="1 photographic print :",
-                b="gelatin silver ;",
-                c="10 x 56 in.",
-            )
-        )
-        desc = record.physical_description
-        assert desc is not None
-
-
 class TestRecordLocation:
     """PYMARC COMPAT: test_location"""
 
@@ -480,7 +433,7 @@ class TestMARCReaderRecordCount:
             if record:
                 count += 1
 
-        assert count > 0
+        assert count == 1000
 
 
 # ============================================================================
@@ -578,7 +531,7 @@ class TestRoundTripSerialization:
         marc_bytes = original.to_marc21()
 
         # Deserialize
-        reader = MARCReader(io.BytesIO(marc_bytes))
+        reader = MARCReader(marc_bytes)
         restored = reader.read_record()
 
         assert restored is not None
@@ -589,21 +542,15 @@ class TestRoundTripSerialization:
 class TestMultipleFormats:
     """PYMARC COMPAT: Test output formats"""
 
-    def test_json_roundtrip_concept(self):
+    def test_json_roundtrip_concept(self, serialized_record):
         """Test JSON serialization."""
-        record = Record()
-        record.add_field(create_field("245", "1", "0", a="Title"))
-
-        json_str = record.to_json()
+        json_str, _ = serialized_record
         assert isinstance(json_str, str)
         assert len(json_str) > 0
 
-    def test_xml_serialization(self):
+    def test_xml_serialization(self, serialized_record):
         """Test XML serialization."""
-        record = Record()
-        record.add_field(create_field("245", "1", "0", a="Title"))
-
-        xml_str = record.to_xml()
+        _, xml_str = serialized_record
         assert isinstance(xml_str, str)
         assert len(xml_str) > 0
 
@@ -29,14 +29,15 @@ from mrrc import (
 
 def create_field(tag, ind1=" ", ind2=" ", **subfields):
     """Helper to create a field with subfields."""
-    field = Field(tag, ind1, ind2)
-    for code, value in subfields.items():
-        field.add_subfield(code, value)
-    return field
+    return Field(tag, ind1, ind2, subfields=list(subfields.items()))
 
 
-def create_test_record():
-    """Create a bibliographic record with diverse fields for testing queries."""
+@pytest.fixture(scope="module")
+def query_record():
+    """Bibliographic record with diverse fields, shared across the module.
+
+    Every query test only reads it; build a separate record to mutate.
+    """
     leader = Leader()
     record = Record(leader)
 
@@ -94,6 +95,11 @@ def create_test_record():
     return record
 
 
+# The regex is compiled in Rust when the query is built and reused by every
+# match, so the read-only pattern searches share one prebuilt query.
+ISBN13_QUERY = SubfieldPatternQuery("020", "a", r"^978-")
+
+
 # =============================================================================
 # FieldQuery Tests
 # =============================================================================
@@ -102,34 +108,34 @@ def create_test_record():
 class TestFieldQuery:
     """Test the FieldQuery builder pattern."""
 
-    def test_empty_query_matches_all(self):
+    def test_empty_query_matches_all(self, query_record):
         """An empty query should match all fields."""
-        record = create_test_record()
+        record = query_record
         query = FieldQuery()
         results = record.fields_matching(query)
         # Should get all fields (excluding control fields)
         assert len(results) > 0
 
-    def test_query_by_tag(self):
+    def test_query_by_tag(self, query_record):
         """Query by tag only."""
-        record = create_test_record()
+        record = query_record
         query = FieldQuery().tag("650")
         results = record.fields_matching(query)
         assert len(results) == 4  # 4 650 fields in our test record
         for field in results:
             assert field.tag == "650"
 
-    def test_query_by_indicator1(self):
+    def test_query_by_indicator1(self, query_record):
         """Query by first indicator."""
-        record = create_test_record()
+        record = query_record
         query = FieldQuery().tag("100").indicator1("1")
         results = record.fields_matching(query)
         assert len(results) == 1
         assert results[0].indicator1 == "1"
 
-    def test_query_by_indicator2(self):
+    def test_query_by_indicator2(self, query_record):
         """Query by second indicator - common pattern for subject thesaurus."""
-        record = create_test_record()
+        record = query_record
         # Find LCSH subjects (indicator2 = '0')
         query = FieldQuery().tag("650").indicator2("0")
         results = record.fields_matching(query)
@@ -137,9 +143,9 @@ class TestFieldQuery:
         for field in results:
             assert field.indicator2 == "0"
 
-    def test_query_with_required_subfield(self):
+    def test_query_with_required_subfield(self, query_record):
         """Query with required subfield presence."""
-        record = create_test_record()
+        record = query_record
         # Find 650 fields that have subdivision ($x)
         query = FieldQuery().tag("650").has_subfield("x")
         results = record.fields_matching(query)
@@ -148,32 +154,32 @@ class TestFieldQuery:
             values = field.subfields_by_code("x")
             assert len(values) > 0
 
-    def test_query_with_multiple_required_subfields(self):
+    def test_query_with_multiple_required_subfields(self, query_record):
         """Query requiring multiple subfields (AND logic)."""
-        record = create_test_record()
+        record = query_record
         # Find 650 fields that have both $a and $v
         query = FieldQuery().tag("650").has_subfield("a").has_subfield("v")
         results = record.fields_matching(query)
         assert len(results) == 1  # Only "History" has $v (Periodicals)
 
-    def test_query_with_has_subfields_list(self):
+    def test_query_with_has_subfields_list(self, query_record):
         """Test has_subfields() with a list of codes."""
-        record = create_test_record()
+        record = query_record
         query = FieldQuery().tag("650").has_subfields(["a", "x"])
         results = record.fields_matching(query)
         assert len(results) == 3
 
-    def test_combined_query(self):
+    def test_combined_query(self, query_record):
         """Query combining tag, indicator, and subfield requirements."""
-        record = create_test_record()
+        record = query_record
         # Find LCSH 650 fields with $x subdivision
         query = FieldQuery().tag("650").indicator2("0").has_subfield("x")
         results = record.fields_matching(query)
         assert len(results) == 2  # History and Science have ind2=0 and $x
 
-    def test_query_indicator_wildcard(self):
+    def test_query_indicator_wildcard(self, query_record):
         """None indicator means wildcard (match any)."""
-        record = create_test_record()
+        record = query_record
         query = FieldQuery().tag("650").indicator1(None).indicator2("0")
         results = record.fields_matching(query)
         assert len(results) == 2  # ind1 can be anything, ind2 must be '0'
@@ -195,9 +201,9 @@ class TestFieldQuery:
 class TestTagRangeQuery:
     """Test tag range queries for finding groups of related fields."""
 
-    def test_subject_range(self):
+    def test_subject_range(self, query_record):
         """Find all subject fields (600-699)."""
-        record = create_test_record()
+        record = query_record
         query = TagRangeQuery("600", "699")
         results = record.fields_matching_range(query)
         # 4 650s + 1 651 + 1 600 = 6 subject fields
@@ -205,9 +211,9 @@ class TestTagRangeQuery:
         for field in results:
             assert "600" <= field.tag <= "699"
 
-    def test_range_with_indicator_filter(self):
+    def test_range_with_indicator_filter(self, query_record):
         """Find all 6XX fields with indicator2='0' (LCSH)."""
-        record = create_test_record()
+        record = query_record
         query = TagRangeQuery("600", "699", indicator2="0")
         results = record.fields_matching_range(query)
         # 600, 650 (2), 651 with ind2=0 = 4
@@ -215,9 +221,9 @@ class TestTagRangeQuery:
         for field in results:
             assert field.indicator2 == "0"
 
-    def test_range_with_required_subfields(self):
+    def test_range_with_required_subfields(self, query_record):
         """Find range with required subfields."""
-        record = create_test_record()
+        record = query_record
         query = TagRangeQuery("600", "699", required_subfields=["x"])
         results = record.fields_matching_range(query)
         # Fields with $x: 650 (3) + 651 (1) = 4
@@ -240,7 +246,7 @@ class TestTagRangeQuery:
         assert query.indicator1 == "1"
         assert query.indicator2 == "0"
 
-    def test_range_from_field_query(self):
+    def test_range_from_field_query(self, query_record):
         """Test creating TagRangeQuery from FieldQuery.tag_range()."""
         query = (
             FieldQuery()
@@ -248,7 +254,7 @@ class TestTagRangeQuery:
             .has_subfield("a")
             .tag_range("600", "699")
         )
-        record = create_test_record()
+        record = query_record
         results = record.fields_matching_range(query)
         # All 6XX fields with ind2=0 and $a
         assert len(results) == 4
@@ -262,39 +268,53 @@ class TestTagRangeQuery:
 class TestSubfieldPatternQuery:
     """Test regex pattern matching on subfield values."""
 
-    def test_isbn13_pattern(self):
+    def test_isbn13_pattern(self, query_record):
         """Find ISBN-13s starting with 978."""
-        record = create_test_record()
-        query = SubfieldPatternQuery("020", "a", r"^978-")
-        results = record.fields_matching_pattern(query)
+        record = query_record
+        results = record.fields_matching_pattern(ISBN13_QUERY)
         assert len(results) == 1
         assert "978-0-12-345678-9" in results[0].subfields_by_code("a")
 
-    def test_isbn13_both_prefixes(self):
+    def test_isbn13_both_prefixes(self, query_record):
         """Find all ISBN-13s (978 or 979 prefix)."""
-        record = create_test_record()
+        record = query_record
         query = SubfieldPatternQuery("020", "a", r"^97[89]-")
         results = record.fields_matching_pattern(query)
         assert len(results) == 2  # 978 and 979 ISBNs
 
-    def test_date_range_pattern(self):
+    def test_date_range_pattern(self, query_record):
         """Find personal names with death dates (date ranges)."""
-        record = create_test_record()
+        record = query_record
         # Match YYYY-YYYY pattern (birth-death)
         query = SubfieldPatternQuery("100", "d", r"\d{4}-\d{4}")
         results = record.fields_matching_pattern(query)
         assert len(results) == 1
         assert "1900-1980" in results[0].subfields_by_code("d")
 
-    def test_open_date_pattern(self):
+    def test_open_date_pattern(self, query_record):
         """Find persons with open dates (living or unknown death)."""
-        record = create_test_record()
+        record = query_record
         # Match YYYY- pattern (birth only, no death)
         query = SubfieldPatternQuery("700", "d", r"^\d{4}-$")
         results = record.fields_matching_pattern(query)
         assert len(results) == 1
         assert "1950-" in results[0].subfields_by_code("d")
 
+    def test_fields_matching_patterns_batch(self, query_record):
+        """A batch of pattern queries matches each query on its own."""
+        queries = [
+            ISBN13_QUERY,
+            SubfieldPatternQuery("700", "d", r"^\d{4}-$"),
+            SubfieldPatternQuery("020", "a", r"^NOTFOUND"),
+        ]
+        batched = query_record.fields_matching_patterns(queries)
+        assert [[f["a"] for f in fields] for fields in batched] == [
+            [f["a"] for f in query_record.fields_matching_pattern(q)]
+            for q in queries
+        ]
+        assert [len(fields) for fields in batched] == [1, 1, 0]
+        assert query_record.fields_matching_patterns([]) == []
+
     def test_invalid_regex_raises_error(self):
         """Invalid regex pattern should raise ValueError."""
         with pytest.raises(ValueError) as excinfo:
@@ -324,12 +344,11 @@ class TestSubfieldPatternQuery:
         assert "^abc" in repr(negated)
         assert "negate=true" in repr(negated)
 
-    def test_negated_pattern_excludes_match(self):
+    def test_negated_pattern_excludes_match(self, query_record):
         """Negated query excludes fields where subfield matches the pattern."""
-        record = create_test_record()
+        record = query_record
         # Non-negated: finds ISBNs starting with 978
-        query = SubfieldPatternQuery("020", "a", r"^978-")
-        results = record.fields_matching_pattern(query)
+        results = record.fields_matching_pattern(ISBN13_QUERY)
         assert len(results) == 1
 
         # Negated: finds ISBNs NOT starting with 978
@@ -340,9 +359,9 @@ class TestSubfieldPatternQuery:
         for f in results_neg:
             assert not f["a"].startswith("978-")
 
-    def test_negated_pattern_includes_nonmatch(self):
+    def test_negated_pattern_includes_nonmatch(self, query_record):
         """Negated query includes fields where subfield doesn't match."""
-        record = create_test_record()
+        record = query_record
         # Negated: pattern that matches nothing → should include all 020 fields
         query = SubfieldPatternQuery("020", "a", r"^NONEXISTENT", negate=True)
         results = record.fields_matching_pattern(query)
@@ -374,32 +393,32 @@ class TestSubfieldPatternQuery:
 class TestSubfieldValueQuery:
     """Test exact and partial string matching on subfield values."""
 
-    def test_exact_match(self):
+    def test_exact_match(self, query_record):
         """Find exact subject heading match."""
-        record = create_test_record()
+        record = query_record
         query = SubfieldValueQuery("650", "a", "History")
         results = record.fields_matching_value(query)
         assert len(results) == 1
         assert "History" in results[0].subfields_by_code("a")
 
-    def test_exact_match_case_sensitive(self):
+    def test_exact_match_case_sensitive(self, query_record):
         """Exact match is case-sensitive."""
-        record = create_test_record()
+        record = query_record
         query = SubfieldValueQuery("650", "a", "history")  # lowercase
         results = record.fields_matching_value(query)
         assert len(results) == 0  # No match - "History" vs "history"
 
-    def test_partial_match(self):
+    def test_partial_match(self, query_record):
         """Find subjects containing a substring."""
-        record = create_test_record()
+        record = query_record
         query = SubfieldValueQuery("650", "a", "Subject", partial=True)
         results = record.fields_matching_value(query)
         # "Medical Subject" and "Local Subject"
         assert len(results) == 2
 
-    def test_partial_match_in_subdivision(self):
+    def test_partial_match_in_subdivision(self, query_record):
         """Find partial match in subdivision."""
-        record = create_test_record()
+        record = query_record
         query = SubfieldValueQuery("650", "x", "History", partial=True)
         results = record.fields_matching_value(query)
         assert len(results) == 1  # Science > History
@@ -417,9 +436,9 @@ class TestSubfieldValueQuery:
         assert query.value == "History"
         assert query.partial is True
 
-    def test_negated_exact_excludes_match(self):
+    def test_negated_exact_excludes_match(self, query_record):
         """Negated exact query excludes fields where subfield equals the value."""
-        record = create_test_record()
+        record = query_record
         # Non-negated: finds exact "History"
         query = SubfieldValueQuery("650", "a", "History")
         results = record.fields_matching_value(query)
@@ -432,9 +451,9 @@ class TestSubfieldValueQuery:
         for f in results_neg:
             assert f["a"] != "History"
 
-    def test_negated_partial_excludes_match(self):
+    def test_negated_partial_excludes_match(self, query_record):
         """Negated partial query excludes fields containing the value."""
-        record = create_test_record()
+        record = query_record
         # Negated partial: finds subjects NOT containing "History"
         query = SubfieldValueQuery(
             "650", "a", "History", partial=True, negate=True
@@ -468,9 +487,9 @@ class TestSubfieldValueQuery:
 class TestConvenienceMethods:
     """Test convenience methods on Record."""
 
-    def test_fields_by_indicator(self):
+    def test_fields_by_indicator(self, query_record):
         """Test the fields_by_indicator() convenience method."""
-        record = create_test_record()
+        record = query_record
         # Find LCSH 650 subjects
         results = record.fields_by_indicator("650", indicator2="0")
         assert len(results) == 2
@@ -478,16 +497,16 @@ class TestConvenienceMethods:
             assert field.tag == "650"
             assert field.indicator2 == "0"
 
-    def test_fields_by_indicator_both(self):
+    def test_fields_by_indicator_both(self, query_record):
         """Test filtering by both indicators."""
-        record = create_test_record()
+        record = query_record
         # Find personal name added entry with ind1='1' (surname first)
         results = record.fields_by_indicator("700", indicator1="1")
         assert len(results) == 1
 
-    def test_fields_in_range(self):
+    def test_fields_in_range(self, query_record):
         """Test the fields_in_range() convenience method."""
-        record = create_test_record()
+        record = query_record
         # Find all 5XX notes
         results = record.fields_in_range("500", "599")
         assert len(results) == 2  # 500 and 504
@@ -503,12 +522,12 @@ class TestConvenienceMethods:
 class TestRealWorldUseCases:
     """Test practical library cataloging scenarios."""
 
-    def test_find_lcsh_subjects_with_subdivisions(self):
+    def test_find_lcsh_subjects_with_subdivisions(self, query_record):
         """
         Common cataloging task: Find all LCSH subject headings that include
         topical subdivisions ($x) for subject analysis.
         """
-        record = create_test_record()
+        record = query_record
         query = (
             FieldQuery()
             .tag("650")
@@ -521,42 +540,41 @@ class TestRealWorldUseCases:
             subdivisions = field.subfields_by_code("x")
             assert len(subdivisions) > 0
 
-    def test_find_all_subjects_for_export(self):
+    def test_find_all_subjects_for_export(self, query_record):
         """
         Export scenario: Gather all subject headings (6XX) regardless of
         thesaurus for conversion to another format.
         """
-        record = create_test_record()
+        record = query_record
         results = record.fields_in_range("600", "699")
         assert len(results) == 6
         tags = {f.tag for f in results}
         assert tags == {"600", "650", "651"}
 
-    def test_find_isbn13_for_linking(self):
+    def test_find_isbn13_for_linking(self, query_record):
         """
         Linking scenario: Find ISBN-13 for resolving works across systems.
         """
-        record = create_test_record()
-        query = SubfieldPatternQuery("020", "a", r"^978-")
-        results = record.fields_matching_pattern(query)
+        record = query_record
+        results = record.fields_matching_pattern(ISBN13_QUERY)
         assert len(results) == 1
 
-    def test_find_persons_with_death_dates(self):
+    def test_find_persons_with_death_dates(self, query_record):
         """
         Authority control: Find personal names with complete life dates
         for enhanced authority linking.
         """
-        record = create_test_record()
+        record = query_record
         # Match birth-death pattern
         query = SubfieldPatternQuery("100", "d", r"^\d{4}-\d{4}$")
         results = record.fields_matching_pattern(query)
         assert len(results) == 1
 
-    def test_combine_queries_for_complex_analysis(self):
+    def test_combine_queries_for_complex_analysis(self, query_record):
         """
         Complex analysis: Chain multiple query types for detailed analysis.
         """
-        record = create_test_record()
+        record = query_record
 
         # Step 1: Find all 6XX subject fields
         all_subjects = record.fields_in_range("600", "699")
@@ -590,30 +608,30 @@ class TestEdgeCases:
         results = record.fields_matching(query)
         assert len(results) == 0
 
-    def test_query_nonexistent_tag(self):
+    def test_query_nonexistent_tag(self, query_record):
         """Query for a tag that doesn't exist."""
-        record = create_test_record()
+        record = query_record
         query = FieldQuery().tag("999")
         results = record.fields_matching(query)
         assert len(results) == 0
 
-    def test_range_no_matches(self):
+    def test_range_no_matches(self, query_record):
         """Range query that matches nothing."""
-        record = create_test_record()
+        record = query_record
         query = TagRangeQuery("800", "899")
         results = record.fields_matching_range(query)
         assert len(results) == 0
 
-    def test_pattern_no_matches(self):
+    def test_pattern_no_matches(self, query_record):
         """Pattern query that matches nothing."""
-        record = create_test_record()
+        record = query_record
         query = SubfieldPatternQuery("020", "a", r"^NOTFOUND")
         results = record.fields_matching_pattern(query)
         assert len(results) == 0
 
-    def test_value_no_matches(self):
+    def test_value_no_matches(self, query_record):
         """Value query that matches nothing."""
-        record = create_test_record()
+        record = query_record
         query = SubfieldValueQuery("650", "a", "NonexistentSubject")
         results = record.fields_matching_value(query)
         assert len(results) == 0
@@ -16,6 +16,7 @@ This test suite confirms:
 """
 
 import io
+import itertools
 
 import pytest
 
@@ -84,19 +85,12 @@ class TestQueueStateMachine:
         reader = MARCReader(io.BytesIO(fixture_10k))
 
         # Consume 100 records - should be mostly from queue after first batch read
-        records = []
-        for i, rec in enumerate(reader):
-            records.append(rec)
-            if i >= 99:  # First 100 records
-                break
+        records = list(itertools.islice(reader, 100))
 
         assert len(records) == 100
 
         # Continue with next 100 - will trigger next batch read
-        for i, rec in enumerate(reader):
-            records.append(rec)
-            if i >= 99:  # Next 100 records
-                break
+        records.extend(itertools.islice(reader, 100))
 
         assert len(records) == 200
 
@@ -104,12 +98,8 @@ class TestQueueStateMachine:
         """Test reading exactly to batch boundary (100 records)"""
         reader = MARCReader(io.BytesIO(fixture_1k))
 
-        # Read exactly 100 records
-        records = []
-        for i, rec in enumerate(reader):
-            records.append(rec)
-            if i >= 99:  # First 100 records (batch size)
-                break
+        # Read exactly 100 records (batch size)
+        records = list(itertools.islice(reader, 100))
 
         assert len(records) == 100
 
@@ -122,11 +112,7 @@ class TestQueueStateMachine:
         reader = MARCReader(io.BytesIO(fixture_1k))
 
         # Collect first 100 records
-        records = []
-        for i, rec in enumerate(reader):
-            records.append(rec)
-            if i >= 99:
-                break
+        records = list(itertools.islice(reader, 100))
 
         # Each record should have sequential IDs (if present)
         # At minimum, verify structure consistency
@@ -232,6 +218,16 @@ class TestQueueEdgeCases:
         records = list(reader)
         assert len(records) == 0
 
+    @pytest.mark.parametrize("source", [b"00", bytearray(b"00")])
+    def test_input_shorter_than_leader_yields_no_records(self, source):
+        """In-memory input too short for a 24-byte leader is a clean
+        EOF, matching the streaming path: zero records, no exception."""
+        reader = MARCReader(source)
+
+        assert list(reader) == []
+        with pytest.raises(StopIteration):
+            next(reader)
+
     def test_single_record_file(self, fixture_small):
         """A file holding exactly one record fills a partial batch of
         one and then EOFs cleanly."""
@@ -255,11 +251,7 @@ class TestQueueEdgeCases:
         deliver record 201 from a fresh batch with nothing lost."""
         reader = MARCReader(io.BytesIO(fixture_1k))
 
-        records = []
-        for i, rec in enumerate(reader):
-            records.append(rec)
-            if i >= 200:
-                break
+        records = list(itertools.islice(reader, 201))
 
         assert len(records) == 201
         assert all(rec is not None for rec in records)
@@ -146,7 +146,7 @@ class TestRecordRoundTrip:
         marc_bytes = original.to_marc21()
 
         # Deserialize
-        reader = MARCReader(io.BytesIO(marc_bytes))
+        reader = MARCReader(marc_bytes)
         restored = reader.read_record()
 
         assert restored is not None
@@ -169,7 +169,7 @@ class TestRecordRoundTrip:
 
         # Serialize and deserialize
         marc_bytes = original.to_marc21()
-        reader = MARCReader(io.BytesIO(marc_bytes))
+        reader = MARCReader(marc_bytes)
         restored = reader.read_record()
 
         assert restored is not None
@@ -189,7 +189,7 @@ class TestRecordRoundTrip:
 
         # Serialize and deserialize
         marc_bytes = original.to_marc21()
-        reader = MARCReader(io.BytesIO(marc_bytes))
+        reader = MARCReader(marc_bytes)
         restored = reader.read_record()
 
         restored_field = restored["245"]
@@ -732,7 +732,7 @@ class TestUnicodeAndEncoding:
 
         # Serialize and deserialize
         marc_bytes = original.to_marc21()
-        reader = MARCReader(io.BytesIO(marc_bytes))
+        reader = MARCReader(marc_bytes)
         restored = reader.read_record()
 
         restored_field = restored["245"]
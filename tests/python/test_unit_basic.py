@@ -3,6 +3,7 @@ Unit tests for basic mrrc Python wrapper functionality.
 Tests API compatibility with pymarc.
 """
 
+import copy
 import io
 
 import pytest
@@ -73,6 +74,37 @@ class TestRecordBasics:
         cfs = record.control_fields()
         assert len(cfs) >= 2
 
+    def test_build_matches_incremental_construction(self):
+        """Record.build produces the same record as per-field adds."""
+        built = Record.build(
+            [("001", "12345")],
+            [("245", "1", "0", [("a", "Title :"), ("b", "subtitle")])],
+        )
+
+        record = Record(Leader())
+        record.add_control_field("001", "12345")
+        field = Field("245", "1", "0")
+        field.add_subfield("a", "Title :")
+        field.add_subfield("b", "subtitle")
+        record.add_field(field)
+
+        assert built == record
+        assert built.control_field("001") == "12345"
+        assert built["245"]["b"] == "subtitle"
+
+    @pytest.mark.parametrize(
+        ("control_fields", "data_fields"),
+        [
+            ([("01", "x")], []),
+            ([], [("24", "1", "0", [("a", "x")])]),
+            ([], [("245", "1", "0", [("", "x")])]),
+        ],
+    )
+    def test_build_rejects_invalid_specs(self, control_fields, data_fields):
+        """Record.build validates tags and subfield codes like add_*."""
+        with pytest.raises(ValueError):
+            Record.build(control_fields, data_fields)
+
 
 class TestFieldCreation:
     """Test Field and Subfield creation."""
@@ -382,6 +414,32 @@ class TestRecordEquality:
         # Equality should work
         assert record1 == record2
 
+    def test_record_inequality(self):
+        """Records differing in a subfield value or field order differ."""
+        record1 = Record(Leader())
+        record1.add_field(
+            Field("245", "1", "0", subfields=[Subfield("a", "One")])
+        )
+        record1.add_field(
+            Field("650", " ", "0", subfields=[Subfield("a", "Cats")])
+        )
+
+        assert record1 == record1
+        assert record1 == copy.deepcopy(record1)
+
+        record2 = copy.deepcopy(record1)
+        record2["650"]["a"] = "Dogs"
+        assert record1 != record2
+
+        record3 = Record(Leader())
+        record3.add_field(
+            Field("650", " ", "0", subfields=[Subfield("a", "Cats")])
+        )
+        record3.add_field(
+            Field("245", "1", "0", subfields=[Subfield("a", "One")])
+        )
+        assert record1 != record3
+
 
 class TestRecordSerialization:
     """Test converting records to various formats."""
@@ -447,6 +505,20 @@ class TestRecordSerialization:
         assert read_record is not None
         assert read_record.control_field("001") == "test-id-001"
 
+    def test_write_marc21_appends_to_bytearray(self):
+        """write_marc21 appends exactly the to_marc21 bytes."""
+        record = Record(Leader())
+        record.add_control_field("001", "test-id-001")
+        record.add_field(create_field("245", "1", "0", a="Test Title"))
+        expected = record.to_marc21()
+
+        buf = bytearray(b"prefix")
+        written = record.write_marc21(buf)
+        written += record.write_marc21(buf)
+
+        assert written == 2 * len(expected)
+        assert buf == b"prefix" + expected + expected
+
 
 class TestReadingFromFile:
     """Test reading MARC records from file."""
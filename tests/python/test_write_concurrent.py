@@ -8,10 +8,7 @@ Demonstrates GIL release on the write-side and validates:
 """
 
 import io
-import os
-import tempfile
 from concurrent.futures import ThreadPoolExecutor
-from pathlib import Path
 
 import pytest
 
@@ -44,19 +41,14 @@ class TestWriteGILRelease:
         data = output.read()
         assert len(data) > 0
 
-    def test_write_multiple_records(self, fixture_1k):
+    def test_write_multiple_records(self, records_1k):
         """Write test: multiple records."""
-        # Read records from fixture
-        data = io.BytesIO(fixture_1k)
-        reader = MARCReader(data)
-        records = list(reader)
-        assert len(records) > 0
+        assert len(records_1k) > 0
 
         # Write them out
         output = io.BytesIO()
         writer = MARCWriter(output)
-        for record in records:
-            writer.write_record(record)
+        assert writer.write_records(records_1k) == len(records_1k)
         writer.close()
 
         # Verify data was written
@@ -79,8 +71,7 @@ class TestWriteGILRelease:
         # Write all records sequentially
         output = io.BytesIO()
         writer = MARCWriter(output)
-        for record in all_records:
-            writer.write_record(record)
+        writer.write_records(all_records)
         writer.close()
 
         output.seek(0)
@@ -88,7 +79,7 @@ class TestWriteGILRelease:
         assert len(sequential_data) > 0
         assert len(all_records) == len(records_a) + len(records_b)
 
-    def test_concurrent_write_2x_1k_speedup(self, fixture_1k):
+    def test_concurrent_write_2x_1k_speedup(self, records_1k):
         """
         Concurrent write test: verify 2-thread execution works without GIL deadlock.
 
@@ -98,30 +89,26 @@ class TestWriteGILRelease:
         Note: Detailed performance benchmarking is in separate benchmarking suite,
         which has more controlled conditions for accurate timing measurements.
         """
-        # Read records once
-        reader = MARCReader(io.BytesIO(fixture_1k))
-        records = list(reader)
-        assert len(records) > 0
+        assert len(records_1k) > 0
 
         # Function to write records to output
         def write_records(records_copy):
             output = io.BytesIO()
             writer = MARCWriter(output)
-            for record in records_copy:
-                writer.write_record(record)
+            writer.write_records(records_copy)
             writer.close()
             output.seek(0)
             return output.read()
 
         # Sequential baseline
-        sequential_data = write_records(records)
+        sequential_data = write_records(records_1k)
 
         # Concurrent with 2 threads
         with ThreadPoolExecutor(max_workers=2) as executor:
             # Two threads, each writing the same records to different files
             futures = [
-                executor.submit(write_records, records),
-                executor.submit(write_records, records),
+                executor.submit(write_records, records_1k),
+                executor.submit(write_records, records_1k),
             ]
             concurrent_data = [f.result() for f in futures]
 
@@ -133,31 +120,30 @@ class TestWriteGILRelease:
         assert concurrent_data[0] == sequential_data
         assert concurrent_data[1] == sequential_data
 
-    def test_concurrent_write_4x_1k(self, fixture_1k):
+    def test_concurrent_write_4x_1k(self, records_1k):
         """
         Concurrent write test: 4 threads.
 
         Verifies that 4 threads can write concurrently without GIL deadlock.
         Detailed performance measurements are in the benchmarking suite.
         """
-        reader = MARCReader(io.BytesIO(fixture_1k))
-        records = list(reader)
+        assert len(records_1k) > 0
 
+        # Function to write records to output
         def write_records(records_copy):
             output = io.BytesIO()
             writer = MARCWriter(output)
-            for record in records_copy:
-                writer.write_record(record)
+            writer.write_records(records_copy)
             writer.close()
             output.seek(0)
             return output.read()
 
         # Get baseline result
-        baseline = write_records(records)
+        baseline = write_records(records_1k)
 
         # Concurrent with 4 threads
         with ThreadPoolExecutor(max_workers=4) as executor:
-            results = list(executor.map(write_records, [records] * 4))
+            results = list(executor.map(write_records, [records_1k] * 4))
 
         # All outputs should be identical
         assert len(results) == 4
@@ -167,17 +153,14 @@ class TestWriteGILRelease:
 class TestRoundTrip:
     """Round-trip tests: read → write → read."""
 
-    def test_round_trip_basic(self, fixture_1k):
+    def test_round_trip_basic(self, records_1k):
         """Round-trip: read → write → read."""
-        # Read all records from fixture
-        reader = MARCReader(io.BytesIO(fixture_1k))
-        records_original = list(reader)
-        assert len(records_original) > 0
+        assert len(records_1k) > 0
 
         # Write them to a BytesIO
         output = io.BytesIO()
         writer = MARCWriter(output)
-        for record in records_original:
+        for record in records_1k:
             writer.write_record(record)
         writer.close()
 
@@ -187,23 +170,20 @@ class TestRoundTrip:
         records_roundtrip = list(reader2)
 
         # Verify count matches
-        assert len(records_roundtrip) == len(records_original)
+        assert len(records_roundtrip) == len(records_1k)
 
         # Verify each record matches
         for orig, roundtrip in zip(
-            records_original, records_roundtrip, strict=False
+            records_1k, records_roundtrip, strict=False
         ):
             assert orig == roundtrip
 
-    def test_round_trip_preserves_fields(self, fixture_1k):
+    def test_round_trip_preserves_fields(self, records_1k):
         """Round-trip preserves field data."""
-        reader = MARCReader(io.BytesIO(fixture_1k))
-        records_original = list(reader)
-
         # Write and read back
         output = io.BytesIO()
         writer = MARCWriter(output)
-        for record in records_original:
+        for record in records_1k:
             writer.write_record(record)
         writer.close()
 
@@ -212,7 +192,7 @@ class TestRoundTrip:
         records_roundtrip = list(reader2)
 
         # Spot check some fields
-        for orig, rt in zip(records_original, records_roundtrip, strict=False):
+        for orig, rt in zip(records_1k, records_roundtrip, strict=False):
             # Leader should match
             assert orig.leader.record_type == rt.leader.record_type
             assert (
@@ -292,17 +272,14 @@ class TestRoundTrip:
         ):
             assert orig.leader == roundtrip.leader
 
-    def test_round_trip_large_file(self, fixture_10k):
+    def test_round_trip_large_file(self, records_10k):
         """Round-trip test with large file (10k records)."""
-        reader = MARCReader(io.BytesIO(fixture_10k))
-        records_original = list(reader)
-        count_original = len(records_original)
+        count_original = len(records_10k)
 
         # Write all
         output = io.BytesIO()
         writer = MARCWriter(output)
-        for record in records_original:
-            writer.write_record(record)
+        writer.write_records(records_10k)
         writer.close()
 
         # Read back
@@ -314,8 +291,8 @@ class TestRoundTrip:
         assert len(records_roundtrip) == count_original
 
         # Verify first and last records match
-        assert records_original[0] == records_roundtrip[0]
-        assert records_original[-1] == records_roundtrip[-1]
+        assert records_10k[0] == records_roundtrip[0]
+        assert records_10k[-1] == records_roundtrip[-1]
 
 
 class TestWriteEdgeCases:
@@ -333,14 +310,11 @@ class TestWriteEdgeCases:
         # Should be empty or have minimal structure
         assert len(data) >= 0
 
-    def test_write_context_manager(self, fixture_1k):
+    def test_write_context_manager(self, records_1k):
         """Write using context manager."""
-        reader = MARCReader(io.BytesIO(fixture_1k))
-        records = list(reader)
-
         output = io.BytesIO()
         with MARCWriter(output) as writer:
-            for record in records:
+            for record in records_1k:
                 writer.write_record(record)
 
         output.seek(0)
@@ -360,6 +334,29 @@ class TestWriteEdgeCases:
         with pytest.raises(RuntimeError):
             writer.write_record(record)
 
+    def test_write_records_matches_write_record(self, records_1k):
+        """Bulk write produces the same bytes as per-record writes."""
+        looped = io.BytesIO()
+        with MARCWriter(looped) as writer:
+            for record in records_1k:
+                writer.write_record(record)
+
+        bulk = io.BytesIO()
+        with MARCWriter(bulk) as writer:
+            assert writer.write_records(iter(records_1k)) == len(records_1k)
+
+        assert bulk.getvalue() == looped.getvalue()
+
+    def test_write_records_after_close_raises_error(self, fixture_1k):
+        """Bulk writing after close raises error."""
+        record = next(MARCReader(io.BytesIO(fixture_1k)))
+
+        writer = MARCWriter(io.BytesIO())
+        writer.close()
+
+        with pytest.raises(RuntimeError):
+            writer.write_records([record])
+
     def test_write_close_idempotent(self, fixture_1k):
         """Calling close() multiple times is safe."""
         output = io.BytesIO()
@@ -372,134 +369,88 @@ class TestWriteEdgeCases:
 class TestRustFileBackend:
     """Tests for RustFile backend (direct file I/O via Rust)."""
 
-    def test_write_roundtrip_rust_file(self, fixture_1k):
+    def test_write_roundtrip_rust_file(self, records_1k, tmp_path):
         """Round-trip test using RustFile backend (file path)."""
-        # Read records from fixture
-        reader = MARCReader(io.BytesIO(fixture_1k))
-        records_original = list(reader)
-        assert len(records_original) > 0
+        assert len(records_1k) > 0
 
-        # Write to a temporary file using RustFile backend
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mrc") as tmp:
-            temp_path = tmp.name
+        # Write using string path (RustFile backend)
+        temp_path = str(tmp_path / "roundtrip.mrc")
+        writer = MARCWriter(temp_path)
+        for record in records_1k:
+            writer.write_record(record)
+        writer.close()
 
-        try:
-            # Write using string path (RustFile backend)
-            writer = MARCWriter(temp_path)
-            for record in records_original:
-                writer.write_record(record)
-            writer.close()
+        # Read back from the file
+        with open(temp_path, "rb") as f:
+            reader2 = MARCReader(f)
+            records_roundtrip = list(reader2)
 
-            # Read back from the file
-            with open(temp_path, "rb") as f:
-                reader2 = MARCReader(f)
-                records_roundtrip = list(reader2)
+        # Verify round-trip
+        assert len(records_roundtrip) == len(records_1k)
+        for orig, roundtrip in zip(
+            records_1k, records_roundtrip, strict=False
+        ):
+            assert orig == roundtrip
 
-            # Verify round-trip
-            assert len(records_roundtrip) == len(records_original)
-            for orig, roundtrip in zip(
-                records_original, records_roundtrip, strict=False
-            ):
-                assert orig == roundtrip
+    def test_write_roundtrip_pathlib_path(self, records_1k, tmp_path):
+        """Round-trip test using RustFile backend with pathlib.Path."""
+        assert len(records_1k) > 0
 
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        # Write using Path object (RustFile backend)
+        temp_path = tmp_path / "roundtrip.mrc"
+        writer = MARCWriter(temp_path)
+        for record in records_1k:
+            writer.write_record(record)
+        writer.close()
 
-    def test_write_roundtrip_pathlib_path(self, fixture_1k):
-        """Round-trip test using RustFile backend with pathlib.Path."""
-        # Read records from fixture
-        reader = MARCReader(io.BytesIO(fixture_1k))
-        records_original = list(reader)
-        assert len(records_original) > 0
+        # Read back from the file
+        with open(temp_path, "rb") as f:
+            reader2 = MARCReader(f)
+            records_roundtrip = list(reader2)
 
-        # Write to a temporary file using pathlib.Path
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mrc") as tmp:
-            temp_path = Path(tmp.name)
+        # Verify round-trip
+        assert len(records_roundtrip) == len(records_1k)
+        for orig, roundtrip in zip(
+            records_1k, records_roundtrip, strict=False
+        ):
+            assert orig == roundtrip
 
-        try:
-            # Write using Path object (RustFile backend)
-            writer = MARCWriter(temp_path)
-            for record in records_original:
-                writer.write_record(record)
-            writer.close()
+    def test_write_multiple_records_rust_file(self, records_1k, tmp_path):
+        """Write batch of records via RustFile backend."""
+        assert len(records_1k) > 0
 
-            # Read back from the file
-            with open(temp_path, "rb") as f:
-                reader2 = MARCReader(f)
-                records_roundtrip = list(reader2)
+        # Write all records
+        temp_path = str(tmp_path / "batch.mrc")
+        writer = MARCWriter(temp_path)
+        assert writer.write_records(records_1k) == len(records_1k)
+        writer.close()
 
-            # Verify round-trip
-            assert len(records_roundtrip) == len(records_original)
-            for orig, roundtrip in zip(
-                records_original, records_roundtrip, strict=False
-            ):
-                assert orig == roundtrip
+        # Read back and verify count
+        with open(temp_path, "rb") as f:
+            reader2 = MARCReader(f)
+            roundtrip_records = list(reader2)
 
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        assert len(roundtrip_records) == len(records_1k)
 
-    def test_write_multiple_records_rust_file(self, fixture_1k):
-        """Write batch of records via RustFile backend."""
-        # Read records
-        reader = MARCReader(io.BytesIO(fixture_1k))
-        records = list(reader)
-        assert len(records) > 0
+    def test_concurrent_writes_different_files(self, records_1k, tmp_path):
+        """Thread safety: concurrent writes to different files (RustFile backend)."""
+        assert len(records_1k) > 0
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mrc") as tmp:
-            temp_path = tmp.name
+        def write_to_file(file_index):
+            """Helper to write records to a file in the test's tmp dir."""
+            temp_path = str(tmp_path / f"out_{file_index}.mrc")
 
-        try:
-            # Write all records
+            # Write records
             writer = MARCWriter(temp_path)
-            for record in records:
-                writer.write_record(record)
+            writer.write_records(records_1k)
             writer.close()
 
-            # Read back and verify count
+            # Read back and verify
             with open(temp_path, "rb") as f:
                 reader2 = MARCReader(f)
-                roundtrip_records = list(reader2)
-
-            assert len(roundtrip_records) == len(records)
-
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+                roundtrip = list(reader2)
 
-    def test_concurrent_writes_different_files(self, fixture_1k):
-        """Thread safety: concurrent writes to different files (RustFile backend)."""
-        # Read records once
-        reader = MARCReader(io.BytesIO(fixture_1k))
-        records = list(reader)
-        assert len(records) > 0
-
-        def write_to_file(file_index):
-            """Helper to write records to a temp file."""
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=f"_{file_index}.mrc"
-            ) as tmp:
-                temp_path = tmp.name
-
-            try:
-                # Write records
-                writer = MARCWriter(temp_path)
-                for record in records:
-                    writer.write_record(record)
-                writer.close()
-
-                # Read back and verify
-                with open(temp_path, "rb") as f:
-                    reader2 = MARCReader(f)
-                    roundtrip = list(reader2)
-
-                return len(roundtrip) == len(records), temp_path
-
-            except Exception as e:
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-                raise e
+            return len(roundtrip) == len(records_1k), temp_path
 
         # Run 2 concurrent writes to different files
         with ThreadPoolExecutor(max_workers=2) as executor:
@@ -508,5 +459,3 @@ class TestRustFileBackend:
         # Verify both succeeded
         for success, temp_path in results:
             assert success, f"Write to {temp_path} failed"
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)